@@ -14,7 +14,6 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import openpyxl
 import pandas as pd
-import yaml
 
 from .config import (
     DEFAULT_CONFIG as BASE_CONFIG,
@@ -25,7 +24,7 @@ from .ai_client import AIClient
 from .constants import DEFAULT_MAX_WORKERS, DEFAULT_MODEL, DEFAULT_TEMPERATURE
 from .logging_config import get_logger
 from .prompt_builder import PromptBuilder
-from .utils import AIResponseParser
+from .utils import AIResponseParser, read_csv_fast, read_excel_fast, yaml_safe_load
 from .resources import resource_path
 from .exceptions import ConfigurationError, FileProcessingError, ValidationError
 from .token_tracker import TokenUsageTracker
@@ -56,6 +55,10 @@ DEFAULT_CONFIG = {
     # File configuration
     'INPUT_FILE_PATH': '',
     'OUTPUT_FILE_SUFFIX': '_analyzed',
+    # Start CSV output with a UTF-8 BOM so Excel detects the encoding of
+    # Chinese text; False writes plain UTF-8 for pandas/pyarrow consumers
+    'CSV_BOM': True,
+    'OUTPUT_FAST_FORMAT': '',  # "parquet" auto-saves results as Parquet (needs pyarrow); "" keeps the input format
 
     # Processing configuration
     'API_REQUEST_DELAY': 1,
@@ -83,7 +86,7 @@ def load_mode_questions(mode: str) -> Dict[str, Any]:
     if unified_path.exists():
         try:
             with unified_path.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml_safe_load(f)
                 return {
                     "open_questions": data.get("open_questions", []),
                     "yes_no_questions": data.get("yes_no_questions", []),
@@ -198,9 +201,9 @@ def load_and_validate_data(file_path, config, title_column=None, abstract_column
     # Load data
     try:
         if file_path.endswith('.csv'):
-            df = pd.read_csv(file_path, encoding='utf-8-sig')
+            df = read_csv_fast(file_path, encoding='utf-8-sig')
         else:
-            df = pd.read_excel(file_path)
+            df = read_excel_fast(file_path)
     except Exception as e:
         raise IOError(f"读取文件失败: {file_path}\n错误: {e}")
 
@@ -258,6 +261,83 @@ def prepare_dataframe(df, open_questions, yes_no_questions):
         df[f"{q['column_name']}_verified"] = ''
     return df
 
+def compute_screening_statistics(
+    df: pd.DataFrame,
+    open_questions: List[Dict],
+    yes_no_questions: List[Dict],
+    verification_enabled: bool = True,
+) -> Dict[str, Any]:
+    """Summarize screening results without needing an AI client.
+
+    Answers are tallied with one ``value_counts`` per result column and one
+    frame-wide mask for the open questions, rather than per-row Python loops.
+
+    Args:
+        df: DataFrame with screening results
+        open_questions: List of open-ended questions
+        yes_no_questions: List of yes/no questions
+        verification_enabled: Whether to include verification tallies
+
+    Returns:
+        Dictionary with statistics
+    """
+    labels = ['是', '否', '不确定']
+    total = len(df)
+    stats = {
+        'total_articles': total,
+        'verification_enabled': verification_enabled,
+        'yes_no_results': {},
+        'open_question_stats': {}
+    }
+
+    def tally(columns: List[str]) -> pd.DataFrame:
+        # labels x columns table of answer counts
+        columns = list(dict.fromkeys(c for c in columns if c in df.columns))
+        if not columns:
+            return pd.DataFrame(index=labels)
+        return df[columns].apply(lambda s: s.value_counts()).reindex(labels).fillna(0).astype(int)
+
+    # Statistics for yes/no questions
+    yn_counts = tally([q['column_name'] for q in yes_no_questions])
+    ver_counts = tally([f"{q['column_name']}_verified" for q in yes_no_questions]) if verification_enabled else None
+    for q in yes_no_questions:
+        col = q['column_name']
+        if col not in yn_counts.columns:
+            continue
+        counts = yn_counts[col]
+        result = {
+            '是': int(counts['是']),
+            '否': int(counts['否']),
+            '不确定': int(counts['不确定']),
+            '其他': int(total - counts.sum()),
+        }
+        # Verification stats if enabled
+        vcol = f"{col}_verified"
+        if ver_counts is not None and vcol in ver_counts.columns:
+            vc = ver_counts[vcol]
+            result['verification'] = {
+                '已验证': int(vc['是']),
+                '未验证': int(vc['否']),
+                '不确定': int(vc['不确定']),
+            }
+        stats['yes_no_results'][q['question']] = result
+
+    # Statistics for open questions
+    open_cols = list(dict.fromkeys(q['column_name'] for q in open_questions if q['column_name'] in df.columns))
+    if open_cols:
+        answers = df[open_cols]
+        answered = (answers.notna() & ~answers.isin(['', '信息缺失'])).sum()
+        for q in open_questions:
+            col = q['column_name']
+            if col in answered.index:
+                stats['open_question_stats'][q['question']] = {
+                    'answered': int(answered[col]),
+                    'missing': int(total - answered[col])
+                }
+
+    return stats
+
+
 def construct_ai_prompt(title, abstract, research_question, screening_criteria, detailed_analysis_questions, prompts=None):
     """Construct detailed analysis prompt using PromptBuilder."""
     if prompts is None:
@@ -387,18 +467,21 @@ def verify_ai_response(title, abstract, initial_json, client, open_questions, ye
     """
     prompts = load_prompts()
 
+    # Look the answer sections up once rather than once per question
+    initial_qa = initial_json.get("quick_analysis") or {}
+    initial_sr = initial_json.get("screening_results") or {}
     verification_data = {
         "quick_analysis": {
             q["key"]: {
                 "question": q["question"],
-                "answer": initial_json.get("quick_analysis", {}).get(q["key"], "")
+                "answer": initial_qa.get(q["key"], "")
             }
             for q in open_questions
         },
         "screening_results": {
             q["key"]: {
                 "question": q["question"],
-                "answer": initial_json.get("screening_results", {}).get(q["key"], "")
+                "answer": initial_sr.get(q["key"], "")
             }
             for q in yes_no_questions
         },
@@ -887,49 +970,10 @@ class AbstractScreener:
         Returns:
             Dictionary with statistics
         """
-        stats = {
-            'total_articles': len(df),
-            'verification_enabled': self.config.get('ENABLE_VERIFICATION', True),
-            'yes_no_results': {},
-            'open_question_stats': {}
-        }
-
-        # Statistics for yes/no questions
-        for q in yes_no_questions:
-            col = q['column_name']
-            if col in df.columns:
-                value_counts = df[col].value_counts()
-                stats['yes_no_results'][q['question']] = {
-                    '是': int(value_counts.get('是', 0)),
-                    '否': int(value_counts.get('否', 0)),
-                    '不确定': int(value_counts.get('不确定', 0)),
-                    '其他': int(len(df) - value_counts.get('是', 0) -
-                               value_counts.get('否', 0) -
-                               value_counts.get('不确定', 0))
-                }
-
-                # Verification stats if enabled
-                if self.config.get('ENABLE_VERIFICATION', True):
-                    vcol = f"{col}_verified"
-                    if vcol in df.columns:
-                        ver_counts = df[vcol].value_counts()
-                        stats['yes_no_results'][q['question']]['verification'] = {
-                            '已验证': int(ver_counts.get('是', 0)),
-                            '未验证': int(ver_counts.get('否', 0)),
-                            '不确定': int(ver_counts.get('不确定', 0)),
-                        }
-
-        # Statistics for open questions
-        for q in open_questions:
-            col = q['column_name']
-            if col in df.columns:
-                non_empty = df[col].notna() & (df[col] != '') & (df[col] != '信息缺失')
-                stats['open_question_stats'][q['question']] = {
-                    'answered': int(non_empty.sum()),
-                    'missing': int((~non_empty).sum())
-                }
-
-        return stats
+        return compute_screening_statistics(
+            df, open_questions, yes_no_questions,
+            verification_enabled=self.config.get('ENABLE_VERIFICATION', True),
+        )
 
 
 # --- 主程序 ---
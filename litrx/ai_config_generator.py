@@ -11,11 +11,9 @@ import json
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
-import yaml
-
 from .ai_client import AIClient
 from .resources import resource_path
-from .utils import AIResponseParser
+from .utils import AIResponseParser, yaml_safe_load
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -234,7 +232,7 @@ class MatrixDimensionGenerator:
         logger.debug("MatrixDimensionGenerator: received content length=%d", len(content or ""))
         payload = _clean_code_fences(content, "yaml")
         try:
-            data = yaml.safe_load(payload)
+            data = yaml_safe_load(payload)
         except Exception as e:
             logger.error("MatrixDimensionGenerator: YAML parse error: %s", e)
             raise RuntimeError(f"解析AI返回的YAML失败: {e}\n片段: {str(payload)[:400]}")
@@ -4,25 +4,52 @@ Caches AI analysis results to avoid redundant API calls and improve performance.
 """
 import hashlib
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Optional
 from datetime import datetime, timedelta
 
+from .constants import CACHE_MEMORY_MAX_ENTRIES, PDF_FINGERPRINT_BYTES
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+def normalize_cache_text(text: Any) -> str:
+    """
+    Normalize text before it is used as part of a cache key.
+
+    Overlapping exports of the same paper frequently differ only in line
+    breaks, repeated spaces or letter case; collapsing those differences lets
+    such near-duplicates share a single cached result.
+
+    Args:
+        text: Title, abstract or topic (non-strings are converted with str())
+
+    Returns:
+        Whitespace-collapsed, case-folded text
+    """
+    return " ".join(str(text).split()).casefold()
+
+
 class ResultCache:
     """Cache system for AI analysis results."""
 
-    def __init__(self, cache_dir: Optional[Path] = None, ttl_days: int = 30):
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_days: int = 30,
+        max_memory_entries: int = CACHE_MEMORY_MAX_ENTRIES,
+    ):
         """
         Initialize the cache system.
 
         Args:
             cache_dir: Directory for cache files (defaults to ~/.litrx/cache)
             ttl_days: Time-to-live in days for cached results (default: 30)
+            max_memory_entries: Maximum entries held in memory; the least
+                recently used ones are evicted (they stay on disk)
         """
         if cache_dir is None:
             cache_dir = Path.home() / ".litrx" / "cache"
@@ -30,6 +57,13 @@ class ResultCache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = timedelta(days=ttl_days)
+        # In-process copy of entries read or written this session, so repeated
+        # lookups skip the JSON file round-trip
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._max_memory_entries = max_memory_entries
+        # One cache is shared by worker threads; insert, reorder and evict
+        # must not interleave
+        self._memory_lock = threading.Lock()
 
         logger.info(f"ResultCache initialized: {self.cache_dir}, TTL={ttl_days} days")
 
@@ -48,6 +82,14 @@ class ResultCache:
         content = f"{title}|{abstract}|{questions}"
         return hashlib.sha256(content.encode('utf-8')).hexdigest()
 
+    def _remember(self, cache_key: str, cached_data: Dict[str, Any]) -> None:
+        """Store an entry in the memory layer, evicting the least recently used."""
+        with self._memory_lock:
+            self._memory[cache_key] = cached_data
+            self._memory.move_to_end(cache_key)
+            while len(self._memory) > self._max_memory_entries:
+                self._memory.popitem(last=False)
+
     def _get_cache_path(self, cache_key: str) -> Path:
         """Get the file path for a cache key."""
         # Use subdirectories to avoid too many files in one directory
@@ -71,21 +113,28 @@ class ResultCache:
         cache_key = self._get_cache_key(title, abstract, questions)
         cache_path = self._get_cache_path(cache_key)
 
-        if not cache_path.exists():
+        with self._memory_lock:
+            cached_data = self._memory.get(cache_key)
+        if cached_data is None and not cache_path.exists():
             logger.debug(f"Cache miss: {cache_key[:8]}...")
             return None
 
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cached_data = json.load(f)
+            if cached_data is None:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    cached_data = json.load(f)
 
             # Check expiration
             cached_time = datetime.fromisoformat(cached_data['timestamp'])
             if datetime.now() - cached_time > self.ttl:
                 logger.debug(f"Cache expired: {cache_key[:8]}...")
-                cache_path.unlink()  # Delete expired cache
+                with self._memory_lock:
+                    self._memory.pop(cache_key, None)
+                if cache_path.exists():
+                    cache_path.unlink()  # Delete expired cache
                 return None
 
+            self._remember(cache_key, cached_data)
             logger.debug(f"Cache hit: {cache_key[:8]}...")
             return cached_data['result']
 
@@ -134,6 +183,8 @@ class ResultCache:
             'result': result
         }
 
+        self._remember(cache_key, cached_data)
+
         try:
             with open(cache_path, 'w', encoding='utf-8') as f:
                 json.dump(cached_data, f, ensure_ascii=False, indent=2)
@@ -150,6 +201,8 @@ class ResultCache:
         """
         logger.info("Clearing expired cache entries...")
         removed_count = 0
+        with self._memory_lock:
+            self._memory.clear()
 
         try:
             for cache_file in self.cache_dir.rglob("*.json"):
@@ -196,6 +249,8 @@ class ResultCache:
         """
         logger.info("Clearing all cache entries...")
         removed_count = 0
+        with self._memory_lock:
+            self._memory.clear()
 
         try:
             for cache_file in self.cache_dir.rglob("*.json"):
@@ -243,6 +298,91 @@ class ResultCache:
         }
 
 
+class PdfTextCache:
+    """Disk cache for text extracted from PDF files.
+
+    Entries are keyed by a content fingerprint rather than the path, so a
+    renamed or copied PDF is not parsed again, while an edited one is.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the PDF text cache.
+
+        Args:
+            cache_dir: Directory for cached text (defaults to ~/.litrx/pdf_cache)
+        """
+        if cache_dir is None:
+            cache_dir = Path.home() / ".litrx" / "pdf_cache"
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(pdf_path: str) -> str:
+        """
+        Hash the file size plus its first and last blocks.
+
+        Reading only the ends keeps re-checks cheap for large scans; together
+        with the size they change whenever a PDF is edited or re-exported.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            SHA256 hash as hex string
+        """
+        digest = hashlib.sha256()
+        with open(pdf_path, 'rb') as f:
+            size = f.seek(0, 2)
+            digest.update(str(size).encode('ascii'))
+            f.seek(0)
+            digest.update(f.read(PDF_FINGERPRINT_BYTES))
+            if size > PDF_FINGERPRINT_BYTES:
+                f.seek(max(PDF_FINGERPRINT_BYTES, size - PDF_FINGERPRINT_BYTES))
+                digest.update(f.read(PDF_FINGERPRINT_BYTES))
+        return digest.hexdigest()
+
+    def _get_cache_path(self, cache_key: str) -> Path:
+        """Get the file path for a cache key."""
+        cache_subdir = self.cache_dir / cache_key[:2]
+        cache_subdir.mkdir(exist_ok=True)
+        return cache_subdir / f"{cache_key}.txt"
+
+    def get(self, pdf_path: str) -> Optional[str]:
+        """
+        Retrieve the cached text of a PDF.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Extracted text or None if the PDF has not been cached
+        """
+        try:
+            cache_path = self._get_cache_path(self.fingerprint(pdf_path))
+            if not cache_path.exists():
+                return None
+            return cache_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to read cached PDF text for {pdf_path}: {e}")
+            return None
+
+    def set(self, pdf_path: str, text: str) -> None:
+        """
+        Store the extracted text of a PDF.
+
+        Args:
+            pdf_path: Path to the PDF file
+            text: Extracted text
+        """
+        try:
+            cache_path = self._get_cache_path(self.fingerprint(pdf_path))
+            cache_path.write_text(text, encoding='utf-8')
+        except OSError as e:
+            logger.error(f"Failed to cache PDF text for {pdf_path}: {e}")
+
+
 # Global cache instance
 _cache_instance: Optional[ResultCache] = None
 
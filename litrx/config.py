@@ -357,6 +357,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
     "ENABLE_CACHE": True,
     "ENABLE_VERIFICATION": True,
     "LANGUAGE": "en",
+    "NATIVE_FILE_DIALOG": True,
 }
 
 
@@ -8,12 +8,12 @@ logic throughout the codebase.
 from typing import Dict, Any, Tuple, Optional
 from pathlib import Path
 import json
-import yaml
 
 from .constants import DEFAULT_MODEL, DEFAULT_TEMPERATURE, DEFAULT_MAX_WORKERS
 from .config import load_config as base_load_config, DEFAULT_CONFIG
 from .resources import resource_path
 from .logging_config import get_logger
+from .utils import yaml_safe_load
 
 logger = get_logger(__name__)
 
@@ -136,7 +136,7 @@ class ConfigFactory:
         try:
             if Path(q_path).exists():
                 with open(q_path, 'r', encoding='utf-8') as f:
-                    questions = yaml.safe_load(f) or {}
+                    questions = yaml_safe_load(f) or {}
                 logger.debug(f"Loaded {module} questions from {q_path}")
             else:
                 logger.warning(f"Questions file not found: {q_path}, using empty dict")
@@ -163,7 +163,7 @@ class ConfigFactory:
         if yaml_path.exists():
             try:
                 with open(yaml_path, 'r', encoding='utf-8') as f:
-                    questions = yaml.safe_load(f)
+                    questions = yaml_safe_load(f)
                     logger.debug(f"Loaded mode '{mode}' from YAML: {yaml_path}")
                     return questions or {}
             except Exception as e:
@@ -204,7 +204,7 @@ class ConfigFactory:
         try:
             if Path(dim_path).exists():
                 with open(dim_path, 'r', encoding='utf-8') as f:
-                    dimensions = yaml.safe_load(f) or {}
+                    dimensions = yaml_safe_load(f) or {}
                 logger.debug(f"Loaded matrix dimensions from {dim_path}")
                 return dimensions
             else:
@@ -13,6 +13,12 @@ CACHE_DEFAULT_TTL_DAYS = 30
 CACHE_CLEANUP_INTERVAL_DAYS = 7
 """Interval for cache cleanup operations."""
 
+CACHE_MEMORY_MAX_ENTRIES = 10_000
+"""Maximum number of results kept in the in-process cache layer."""
+
+PDF_FINGERPRINT_BYTES = 64 * 1024
+"""Bytes read from each end of a PDF to fingerprint it for the text cache."""
+
 # ========================================
 # Matching Thresholds
 # ========================================
@@ -37,6 +43,12 @@ CHECKPOINT_TIMEOUT_WRITE = 30
 CHECKPOINT_TIMEOUT_READ = 10
 """File lock timeout in seconds for checkpoint read operations."""
 
+LOG_FLUSH_INTERVAL_MS = 100
+"""Delay in milliseconds before queued GUI log lines are appended together."""
+
+LOG_MAX_LINES = 5000
+"""Maximum number of lines kept in a GUI log view; older lines are dropped."""
+
 # ========================================
 # Threading & Concurrency
 # ========================================
@@ -48,6 +60,9 @@ API_REQUEST_DELAY_SECONDS = 0.5
 """Delay between API requests to avoid rate limiting.
 Can be reduced to 0 for APIs with high rate limits."""
 
+EXTRACT_PREFETCH_BATCHES = 2
+"""Batches whose PDF text is extracted ahead of the batches being screened."""
+
 # ========================================
 # File Format
 # ========================================
@@ -60,6 +75,12 @@ SUPPORTED_OUTPUT_FORMATS = ['.csv', '.xlsx']
 DEFAULT_ENCODING = 'utf-8-sig'
 """Default file encoding (UTF-8 with BOM support for Excel compatibility)."""
 
+CSV_CHUNK_SIZE = 10_000
+"""Rows per chunk when streaming large CSV inputs."""
+
+CSV_WRITE_CHUNK_ROWS = 50_000
+"""Rows serialized per step when writing CSV output, bounding temporary memory."""
+
 # ========================================
 # Retry Logic
 # ========================================
@@ -72,6 +93,9 @@ RETRY_DELAY_BASE = 2
 RETRY_DELAYS = [2, 4, 8, 16]
 """Predefined retry delays for exponential backoff (in seconds)."""
 
+RETRY_MAX_DELAY = 30
+"""Upper bound in seconds for a single backoff wait, including Retry-After."""
+
 # ========================================
 # API Configuration
 # ========================================
@@ -81,6 +105,9 @@ DEFAULT_TEMPERATURE = 0.3
 DEFAULT_MODEL = "gpt-4o-mini"
 """Default AI model to use when not specified."""
 
+CHARS_PER_TOKEN_ESTIMATE = 4
+"""Rough characters-per-token ratio used to turn token budgets into text lengths."""
+
 # ========================================
 # Validation
 # ========================================
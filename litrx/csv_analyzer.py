@@ -1,13 +1,12 @@
 # Import modules in the order of standard libraries, third-party libraries, and local modules
+import csv
 import json
 import os
 import time
 from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import pandas as pd
-import yaml
 
 from .config import (
     DEFAULT_CONFIG as BASE_CONFIG,
@@ -15,13 +14,19 @@ from .config import (
     load_config as base_load_config,
 )
 from .ai_client import AIClient
-from .progress_manager import ProgressManager, create_progress_manager
-from .cache import get_cache
-from .constants import CHECKPOINT_INTERVAL, DEFAULT_MODEL, DEFAULT_TEMPERATURE
+from .progress_manager import create_progress_manager
+from .cache import get_cache, normalize_cache_text
+from .constants import (
+    CHECKPOINT_INTERVAL,
+    CSV_CHUNK_SIZE,
+    DEFAULT_MODEL,
+    DEFAULT_TEMPERATURE,
+    MIN_ABSTRACT_LENGTH,
+)
 from .logging_config import get_logger
-from .utils import AIResponseParser, ColumnDetector
+from .utils import PYARROW_AVAILABLE, AIResponseParser, ColumnDetector, read_csv_fast, write_csv_fast, yaml_safe_load
 from .resources import resource_path
-from .exceptions import FileProcessingError, APIError, ValidationError
+from .exceptions import FileProcessingError, APIError
 from .token_tracker import TokenUsageTracker
 
 
@@ -34,6 +39,12 @@ DEFAULT_CONFIG = {
     "TEMPERATURE": DEFAULT_TEMPERATURE,
 }
 
+# Result columns written by LiteratureAnalyzer, in result_values() order
+RESULT_COLUMNS = ['Relevance Score', 'Analysis Result', 'Literature Review Suggestion']
+
+# Free-text columns stored as pyarrow-backed strings when pyarrow is installed
+TEXT_COLUMNS = ['Title', 'Abstract', 'Analysis Result', 'Literature Review Suggestion']
+
 
 def load_config(path: Optional[str] = None, questions_path: Optional[str] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """Load module configuration and question templates."""
@@ -43,7 +54,7 @@ def load_config(path: Optional[str] = None, questions_path: Optional[str] = None
 
     q_path = questions_path or resource_path("configs", "questions", "csv.yaml")
     with open(q_path, 'r', encoding='utf-8') as f:
-        questions = yaml.safe_load(f) or {}
+        questions = yaml_safe_load(f) or {}
 
     return config, questions
 
@@ -92,51 +103,118 @@ Please return in the following JSON format:
     def read_scopus_csv(self, file_path: str) -> pd.DataFrame:
         """Read Scopus exported CSV file"""
         try:
-            df = pd.read_csv(file_path, encoding='utf-8-sig')
-
-            # Use unified column detection
-            title_col = ColumnDetector.get_required_column(df, 'title')
-            abstract_col = ColumnDetector.get_required_column(df, 'abstract')
-
-            # Normalize column names
-            if title_col != 'Title':
-                df['Title'] = df[title_col]
-            if abstract_col != 'Abstract':
-                df['Abstract'] = df[abstract_col]
-
-            # Add columns for analysis results
-            if 'Relevance Score' not in df.columns:
-                df['Relevance Score'] = None
-            if 'Analysis Result' not in df.columns:
-                df['Analysis Result'] = None
-            if 'Literature Review Suggestion' not in df.columns:
-                df['Literature Review Suggestion'] = None
-
-            return df
-        except FileNotFoundError as e:
-            raise FileProcessingError(
+            df = read_csv_fast(file_path, encoding='utf-8-sig')
+            return self._prepare_scopus_frame(df)
+        except Exception as e:
+            raise self._read_error(e, file_path) from e
+
+    def iter_scopus_chunks(self, file_path: str, chunksize: int = CSV_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Read a Scopus exported CSV file in chunks.
+
+        Each chunk is prepared like :meth:`read_scopus_csv` output and keeps
+        its row labels from the full file, so chunks can be concatenated back
+        into one DataFrame.
+
+        Args:
+            file_path: Path to the CSV file
+            chunksize: Number of rows per chunk
+
+        Yields:
+            Prepared DataFrame chunks
+        """
+        try:
+            with pd.read_csv(file_path, encoding='utf-8-sig', chunksize=chunksize) as reader:
+                for chunk in reader:
+                    yield self._prepare_scopus_frame(chunk)
+        except Exception as e:
+            raise self._read_error(e, file_path) from e
+
+    @staticmethod
+    def count_csv_rows(file_path: str) -> int:
+        """Count data rows in a CSV file without building a DataFrame.
+
+        Quoted multi-line fields are counted once, matching what pandas parses.
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+                rows = sum(1 for row in csv.reader(f) if row)
+        except Exception as e:
+            raise LiteratureAnalyzer._read_error(e, file_path) from e
+        return max(rows - 1, 0)
+
+    @staticmethod
+    def valid_rows_mask(df: pd.DataFrame) -> pd.Series:
+        """Return a boolean mask of rows worth sending to the AI.
+
+        Rows with a missing title, or an abstract that is missing or shorter
+        than MIN_ABSTRACT_LENGTH characters, are marked False.
+        """
+        abstract_len = df['Abstract'].astype('string').str.strip().str.len()
+        valid = df['Title'].notna() & abstract_len.ge(MIN_ABSTRACT_LENGTH)
+        return valid.fillna(False).astype(bool)
+
+    def _prepare_scopus_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Normalize title/abstract columns and add result columns."""
+        # Use unified column detection
+        title_col = ColumnDetector.get_required_column(df, 'title')
+        abstract_col = ColumnDetector.get_required_column(df, 'abstract')
+
+        # Normalize column names
+        if title_col != 'Title':
+            df['Title'] = df[title_col]
+        if abstract_col != 'Abstract':
+            df['Abstract'] = df[abstract_col]
+
+        # Add columns for analysis results
+        text_dtype = pd.StringDtype('pyarrow') if PYARROW_AVAILABLE else None
+        for col in RESULT_COLUMNS:
+            if col not in df.columns:
+                if text_dtype is not None and col in TEXT_COLUMNS:
+                    # Pre-allocated with the final dtype so the first result
+                    # written does not convert the whole column
+                    df[col] = pd.array([None] * len(df), dtype=text_dtype)
+                else:
+                    df[col] = None
+
+        if text_dtype is not None:
+            # Contiguous Arrow buffers instead of one Python object per cell
+            df = df.astype({col: text_dtype for col in TEXT_COLUMNS})
+
+        return df
+
+    @staticmethod
+    def _read_error(e: Exception, file_path: str) -> FileProcessingError:
+        """Translate a CSV read failure into a FileProcessingError."""
+        if isinstance(e, FileProcessingError):
+            return e
+        if isinstance(e, FileNotFoundError):
+            return FileProcessingError(
                 f"CSV文件未找到: {file_path}"
-            ) from e
-        except pd.errors.ParserError as e:
-            raise FileProcessingError(
+            )
+        if isinstance(e, pd.errors.ParserError):
+            return FileProcessingError(
                 f"CSV格式错误，请检查文件格式。错误详情: {str(e)}"
-            ) from e
-        except pd.errors.EmptyDataError as e:
-            raise FileProcessingError(
+            )
+        if isinstance(e, pd.errors.EmptyDataError):
+            return FileProcessingError(
                 f"CSV文件为空: {file_path}"
-            ) from e
-        except Exception as e:
-            logger.error(f"读取CSV时发生未预期错误: {e}", exc_info=True)
-            raise FileProcessingError(
-                f"无法读取CSV文件: {str(e)}"
-            ) from e
+            )
+        logger.error(f"读取CSV时发生未预期错误: {e}", exc_info=True)
+        return FileProcessingError(
+            f"无法读取CSV文件: {str(e)}"
+        )
 
     def analyze_paper(self, title: str, abstract: str) -> Dict:
         """Analyze the relevance of a single paper to the research topic"""
-        # Try to get from cache first
+        # Try to get from cache first. Keys are built from normalized text so
+        # that re-exports differing only in whitespace or case still hit.
         if self.cache:
-            cache_key = self.research_topic  # Use research topic as part of cache key
-            cached_result = self.cache.get(title, abstract, cache_key)
+            cache_fields = (
+                normalize_cache_text(title),
+                normalize_cache_text(abstract),
+                normalize_cache_text(self.research_topic),  # Use research topic as part of cache key
+            )
+            cached_result = self.cache.get(*cache_fields)
             if cached_result is not None:
                 self.cache_hits += 1
                 logger.debug(f"Cache hit for '{title[:50]}...'")
@@ -164,8 +242,7 @@ Please return in the following JSON format:
 
             # Cache the result
             if self.cache:
-                cache_key = self.research_topic
-                self.cache.set(title, abstract, result, cache_key)
+                self.cache.set(cache_fields[0], cache_fields[1], result, cache_fields[2])
 
             return result
         except KeyError as e:
@@ -310,12 +387,33 @@ Please return in the following JSON format:
             index: Row index
             result: Analysis result dictionary
         """
-        df.at[index, 'Relevance Score'] = result['relevance_score']
-        df.at[index, 'Analysis Result'] = result['analysis']
-        df.at[index, 'Literature Review Suggestion'] = result.get('literature_review_suggestion', '')
+        for col, value in zip(RESULT_COLUMNS, self.result_values(result)):
+            df.at[index, col] = value
+
+    def apply_results_to_dataframe(self, df: pd.DataFrame, indices: List[Any], values: List[Tuple[Any, Any, Any]]) -> None:
+        """Apply many analysis results to DataFrame in one assignment.
+
+        Args:
+            df: DataFrame to update
+            indices: Row indices
+            values: Matching tuples from :meth:`result_values`
+        """
+        if not indices:
+            return
+        df.loc[indices, RESULT_COLUMNS] = pd.DataFrame(values, index=indices, columns=RESULT_COLUMNS)
+
+    @staticmethod
+    def result_values(result: Dict) -> Tuple[Any, Any, Any]:
+        """Extract the values stored in RESULT_COLUMNS from an analysis result."""
+        suggestion = result.get('literature_review_suggestion', '')
+        return (
+            result['relevance_score'],
+            str(result['analysis']),
+            '' if suggestion is None else str(suggestion),
+        )
 
-    def save_results(self, df: pd.DataFrame, original_file_path: str, is_interim=False):
-        """Save analysis results to CSV file"""
+    def save_results(self, df: pd.DataFrame, original_file_path: str, is_interim=False) -> str:
+        """Save analysis results to CSV file and return the path written"""
         try:
             # Generate new file name
             file_dir = os.path.dirname(original_file_path)
@@ -330,10 +428,11 @@ Please return in the following JSON format:
                 new_file_path = os.path.join(file_dir, f"{file_name}_analyzed_{timestamp}.csv")
 
             # Save to new CSV file
-            df.to_csv(new_file_path, index=False, encoding='utf-8-sig')
+            write_csv_fast(df, new_file_path)
 
             if not is_interim:
                 logger.info(f"\nAnalysis results saved to: {os.path.abspath(new_file_path)}")
+            return new_file_path
         except PermissionError as e:
             logger.error(f"权限错误：无法写入文件: {e}", exc_info=True)
             raise FileProcessingError(
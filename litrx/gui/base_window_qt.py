@@ -2,11 +2,10 @@
 
 import json
 import os
-import subprocess
 from pathlib import Path
 from typing import Dict, Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QUrl, pyqtSignal
 from PyQt6.QtWidgets import (
     QComboBox,
     QFileDialog,
@@ -26,7 +25,7 @@ from PyQt6.QtWidgets import (
     QDialogButtonBox,
     QCheckBox,
 )
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QDesktopServices, QFont
 
 from ..config import DEFAULT_CONFIG as BASE_CONFIG, load_config, load_env_file
 from ..i18n import get_i18n, t
@@ -735,19 +734,12 @@ class LogViewerDialog(QDialog):
 
     def open_log_folder(self) -> None:
         """Open log folder in file explorer."""
-        import platform
-
         log_dir = self.log_file.parent
         if not log_dir.exists():
             QMessageBox.warning(self, t("warning"), "Log directory does not exist yet.")
             return
 
-        try:
-            if platform.system() == "Windows":
-                os.startfile(log_dir)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", log_dir])
-            else:  # Linux
-                subprocess.run(["xdg-open", log_dir])
-        except Exception as e:
-            QMessageBox.critical(self, t("error"), f"Failed to open folder: {e}")
+        # Qt hands the folder to the platform's file manager without blocking
+        # the GUI thread on a child process (xdg-open/open/startfile)
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(log_dir))):
+            QMessageBox.critical(self, t("error"), f"Failed to open folder: {log_dir}")
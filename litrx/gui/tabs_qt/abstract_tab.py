@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 import os
 import threading
-from typing import TYPE_CHECKING, Optional
-
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
+import time
+import traceback
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Deque, Iterable, List, Optional, Tuple
+
+from PyQt6.QtCore import (
+    Qt,
+    pyqtSignal,
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QSettings,
+    QStringListModel,
+    QThread,
+    QTimer,
+)
 from PyQt6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -17,6 +31,7 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QHeaderView,
+    QInputDialog,
     QLabel,
     QLineEdit,
     QListWidget,
@@ -26,29 +41,75 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QSpinBox,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
+import numpy as np
 import pandas as pd
 
 from ...abstract_screener import (
+    DEFAULT_CONFIG as ABSTRACT_DEFAULT_CONFIG,
     load_mode_questions,
     load_and_validate_data,
     prepare_dataframe,
     AbstractScreener,
+    compute_screening_statistics,
 )
+from ...constants import LOG_FLUSH_INTERVAL_MS, LOG_MAX_LINES
 from ...i18n import get_i18n, t
 from ...resources import resource_path
+from ...utils import PYARROW_AVAILABLE, json_dump_file, json_loads, write_csv_fast, write_excel_fast
 from ..dialogs_qt.ai_mode_assistant_qt import AIModeAssistantDialog
 
 if TYPE_CHECKING:
     from ..base_window_qt import BaseWindow
 
 
+def _read_questions_config(path: Path) -> dict:
+    """Parse questions_config.json, using orjson when it is installed."""
+    return json_loads(path.read_bytes())
+
+
+@lru_cache(maxsize=4)
+def _questions_mode_names(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Return the mode names in a questions_config.json version.
+
+    Keyed by the file's (mtime_ns, size) so that saving the file makes the
+    next call re-read it.
+    """
+    return tuple(_read_questions_config(Path(path)).keys())
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=32)
+def _cached_mode_questions(mode: str, signature: Tuple[Optional[Tuple[int, int]], ...]) -> dict:
+    """Return load_mode_questions(mode) for a given version of its config files."""
+    return load_mode_questions(mode)
+
+
+def _mode_questions_for_display(mode: str) -> dict:
+    """Load a mode's questions, reusing the parse until its config files change.
+
+    The result is shared between calls and must not be modified.
+    """
+    signature = (
+        _file_signature(resource_path("configs", "abstract", f"{mode}.yaml")),
+        _file_signature(resource_path("questions_config.json")),
+    )
+    return _cached_mode_questions(mode, signature)
+
+
 class AbstractScreeningWorker(QThread):
     """Worker thread for abstract screening processing.
 
@@ -60,7 +121,8 @@ class AbstractScreeningWorker(QThread):
     update_progress = pyqtSignal(float)  # progress percentage
     update_status = pyqtSignal(str)  # status text
     append_log = pyqtSignal(str)  # log text to append
-    add_result_row = pyqtSignal(int, str, str, str)  # row, title, status, summary
+    initialize_results = pyqtSignal(int)  # total number of articles, emitted before screening starts
+    results_ready = pyqtSignal()  # buffered per-article results are waiting in take_results()
     show_error = pyqtSignal(str, str)  # title, message
     show_info = pyqtSignal(str, str)  # title, message
     enable_export = pyqtSignal()
@@ -85,6 +147,12 @@ class AbstractScreeningWorker(QThread):
         self.stop_event = threading.Event()
         self.df: Optional[pd.DataFrame] = None
 
+        # Finished articles (row, pct, status text, log line, title, status, summary)
+        # waiting for the GUI thread; at most one results_ready signal is queued at a time
+        self._result_buffer: Deque[Tuple[int, float, str, str, str, str, str]] = deque()
+        self._result_lock = threading.Lock()
+        self._drain_pending = False
+
     def stop(self) -> None:
         """Request the worker to stop processing."""
         self.stop_event.set()
@@ -102,6 +170,13 @@ class AbstractScreeningWorker(QThread):
             df = prepare_dataframe(df, open_q, yes_no_q)
 
             total = len(df)
+            # Titles are read per completed article; look them up positionally
+            # in an array instead of building a row Series each time
+            if title_col in df.columns:
+                titles = df[title_col].fillna("").astype(str).str.slice(0, 100).to_numpy(dtype=object)
+            else:
+                titles = np.full(total, "", dtype=object)
+            self.initialize_results.emit(total)
             self.update_status.emit(f"Processing {total} articles with {self.max_workers} concurrent workers...")
             self.append_log.emit(f"Starting concurrent analysis: {total} articles, {self.max_workers} workers")
             self.append_log.emit(f"Verification: {'Enabled' if self.verify_enabled else 'Disabled'}")
@@ -128,18 +203,21 @@ class AbstractScreeningWorker(QThread):
                 index = result.get('index', 0) if result else 0
 
                 # Get title for logging
-                title = str(df.iloc[index].get(title_col, '')) if index < len(df) else ''
-
-                # Update UI - use completed_count for accurate progress
-                self.update_progress.emit(completed_count / total * 100)
-                self.update_status.emit(f"Completed {completed_count}/{total}: {title[:50]}...")
-                self.append_log.emit(f"✓ [{completed_count}/{total}] {title[:50]}...")
+                title = titles[index] if index < len(titles) else ''
 
                 # Add result row to table - use completed_count for sequential row numbers
                 status = "Completed" if result and result.get('initial') else "Skipped"
                 summary = "Analyzed" if result and result.get('initial') else "N/A"
                 # Use completed_count - 1 for 0-based row index in results table
-                self.add_result_row.emit(completed_count - 1, title[:100], status, summary)
+                self._queue_result((
+                    completed_count - 1,
+                    completed_count / total * 100,
+                    f"Completed {completed_count}/{total}: {title[:50]}...",
+                    f"✓ [{completed_count}/{total}] {title[:50]}...",
+                    title,
+                    status,
+                    summary,
+                ))
 
             # Process batch concurrently
             try:
@@ -176,14 +254,12 @@ class AbstractScreeningWorker(QThread):
                 self.append_log.emit(f"错误: 结果列缺失，无法保存")
                 return
 
-            # Check if columns have actual data (not all empty)
-            has_data = False
-            for col in expected_result_cols:
-                if col in df.columns:
-                    non_empty = df[col].notna() & (df[col] != '') & (df[col] != '信息缺失')
-                    if non_empty.any():
-                        has_data = True
-                        break
+            # Check if columns have actual data (not all empty); a single
+            # membership test per column stops at the first filled one
+            has_data = any(
+                (df[col].notna() & ~df[col].isin(('', '信息缺失'))).any()
+                for col in expected_result_cols
+            )
 
             if not has_data:
                 self.append_log.emit(f"警告: 所有结果列都是空的，但仍将保存文件")
@@ -198,6 +274,13 @@ class AbstractScreeningWorker(QThread):
                     suffix = "_analyzed"
                     self.append_log.emit(f"警告: OUTPUT_FILE_SUFFIX 为空，使用默认值 '_analyzed'")
 
+                fast_format = self.config.get("OUTPUT_FAST_FORMAT", ABSTRACT_DEFAULT_CONFIG["OUTPUT_FAST_FORMAT"])
+                if fast_format == "parquet" and not PYARROW_AVAILABLE:
+                    self.append_log.emit("警告: 未安装 pyarrow，无法输出 Parquet，改为使用输入文件格式")
+                    fast_format = ""
+                if fast_format == "parquet":
+                    ext = ".parquet"
+
                 output_file_path = f"{base}{suffix}{ext}"
 
                 # Critical check: ensure we're not overwriting the source file
@@ -217,10 +300,13 @@ class AbstractScreeningWorker(QThread):
                 self.append_log.emit(f"DataFrame大小: {len(df)} 行, {len(df.columns)} 列")
                 self.append_log.emit(f"结果列数量: {len([c for c in expected_result_cols if c in df.columns])}")
 
-                if ext.lower() == ".csv":
-                    df.to_csv(output_file_path, index=False, encoding="utf-8-sig")
+                if ext == ".parquet":
+                    df.to_parquet(output_file_path, index=False, compression="zstd")
+                elif ext.lower() == ".csv":
+                    csv_bom = self.config.get("CSV_BOM", ABSTRACT_DEFAULT_CONFIG["CSV_BOM"])
+                    write_csv_fast(df, output_file_path, encoding="utf-8-sig" if csv_bom else "utf-8")
                 else:
-                    df.to_excel(output_file_path, index=False)
+                    write_excel_fast(df, output_file_path, index=False)
 
                 # Verify file was saved
                 if os.path.exists(output_file_path):
@@ -230,7 +316,6 @@ class AbstractScreeningWorker(QThread):
                 else:
                     self.show_error.emit(t("error"), f"文件保存失败: {output_file_path} 不存在")
             except Exception as e:
-                import traceback
                 error_msg = f"保存文件时出错:\n{str(e)}\n\n{traceback.format_exc()}"
                 self.show_error.emit(t("error"), error_msg)
                 self.append_log.emit(f"✗ 保存失败: {str(e)}")
@@ -238,13 +323,140 @@ class AbstractScreeningWorker(QThread):
             self.enable_export.emit()
 
         except Exception as e:
-            import traceback
             error_msg = f"{str(e)}\n\n{traceback.format_exc()}"
             self.show_error.emit(t("error"), error_msg)
 
         finally:
             self.finished_processing.emit()
 
+    def _queue_result(self, entry: Tuple[int, float, str, str, str, str, str]) -> None:
+        """Buffer a finished article, signalling the GUI only if no drain is pending."""
+        self._result_buffer.append(entry)
+        with self._result_lock:
+            if self._drain_pending:
+                return
+            self._drain_pending = True
+        self.results_ready.emit()
+
+    def take_results(self) -> List[Tuple[int, float, str, str, str, str, str]]:
+        """Return and clear all buffered results (called from main thread)."""
+        with self._result_lock:
+            self._drain_pending = False
+        entries = []
+        while self._result_buffer:
+            entries.append(self._result_buffer.popleft())
+        return entries
+
+
+class AbstractExportWorker(QThread):
+    """Worker thread that writes screening results to a user-chosen file.
+
+    Large frames take seconds to serialize (much longer for Excel), so the
+    write runs off the GUI thread and reports back through signals.
+    """
+
+    update_progress = pyqtSignal(float)  # percentage of CSV rows written
+    export_succeeded = pyqtSignal()
+    export_failed = pyqtSignal(str)  # error message
+
+    def __init__(self, df: pd.DataFrame, path: str, file_type: str):
+        """Initialize the worker.
+
+        Args:
+            df: Results to export
+            path: Path chosen in the save dialog
+            file_type: "csv" or "xlsx"
+        """
+        super().__init__()
+        self.df = df
+        self.path = path
+        self.file_type = file_type
+
+    def run(self) -> None:
+        """Write the results (executed in background thread)."""
+        try:
+            if self.file_type == "csv":
+                write_csv_fast(self.df, self.path, progress_callback=self._report_progress)
+            else:
+                write_excel_fast(self.df, self.path, index=False)
+        except Exception as e:
+            self.export_failed.emit(str(e))
+        else:
+            self.export_succeeded.emit()
+
+    def _report_progress(self, written: int, total: int) -> None:
+        """Forward CSV chunk progress to the GUI."""
+        if total:
+            self.update_progress.emit(written / total * 100)
+
+
+class AbstractResultsModel(QAbstractTableModel):
+    """Table model for the abstract screening results preview.
+
+    Titles, statuses and summaries are kept in per-column lists and the view
+    only queries the cells it paints, so no widget item is created per cell.
+    A whole drain of worker results is applied with one row insertion and
+    one dataChanged notification.
+    """
+
+    COLUMN_COUNT = 3
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._titles: List[str] = []
+        self._statuses: List[str] = []
+        self._summaries: List[str] = []
+        self._headers: List[str] = ["Title", "Status", "Summary"]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._titles)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            column = (self._titles, self._statuses, self._summaries)[index.column()]
+            return column[index.row()]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):  # noqa: N802
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def set_rows(self, rows: Iterable[Tuple[int, str, str, str]]) -> None:
+        """Set (row, title, status, summary) values, growing the model once if needed."""
+        rows = list(rows)
+        if not rows:
+            return
+        lo = min(r[0] for r in rows)
+        hi = max(r[0] for r in rows)
+        if hi >= len(self._titles):
+            added = hi + 1 - len(self._titles)
+            self.beginInsertRows(QModelIndex(), len(self._titles), hi)
+            self._titles.extend([""] * added)
+            self._statuses.extend([""] * added)
+            self._summaries.extend([""] * added)
+            self.endInsertRows()
+        for row, title, status, summary in rows:
+            self._titles[row] = title
+            self._statuses[row] = status
+            self._summaries[row] = summary
+        self.dataChanged.emit(self.index(lo, 0), self.index(hi, self.COLUMN_COUNT - 1))
+
+    def reset_rows(self, count: int) -> None:
+        """Replace the contents with ``count`` empty rows."""
+        self.beginResetModel()
+        self._titles = [""] * count
+        self._statuses = [""] * count
+        self._summaries = [""] * count
+        self.endResetModel()
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.reset_rows(0)
+
 
 class AbstractTab(QWidget):
     """Tab for abstract screening."""
@@ -255,9 +467,17 @@ class AbstractTab(QWidget):
 
         # Worker thread and data
         self.worker: Optional[AbstractScreeningWorker] = None
+        self.export_worker: Optional[AbstractExportWorker] = None
         self.df: Optional[pd.DataFrame] = None
         self.mode_options = []
 
+        # Writable questions_config.json location, resolved on first save
+        self._resolved_q_path: Optional[Path] = None
+
+        # Log lines waiting for the next timed flush into log_text
+        self._log_buffer: List[str] = []
+        self._log_flush_pending = False
+
         # Main layout with splitter
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(5, 5, 5, 5)
@@ -288,9 +508,14 @@ class AbstractTab(QWidget):
         left_layout.addWidget(self.mode_label)
 
         mode_layout = QHBoxLayout()
-        self._load_modes()
+        # Modes are edited in place in this model instead of rebuilding the combo;
+        # it is filled from questions_config.json once the tab has been shown
+        self.mode_model = QStringListModel(self)
         self.mode_combo = QComboBox()
-        self.mode_combo.addItems(self.mode_options)
+        # Shown while the combo has no selection: first while modes load, then when none exist
+        self._mode_placeholder_key = "loading_modes"
+        self.mode_combo.setPlaceholderText(t(self._mode_placeholder_key))
+        self.mode_combo.setModel(self.mode_model)
         mode_layout.addWidget(self.mode_combo)
 
         self.add_mode_btn = QPushButton(t("add_mode"))
@@ -413,6 +638,8 @@ class AbstractTab(QWidget):
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(150)
+        # Keep long runs from growing the log document without bound
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_LINES)
         left_layout.addWidget(self.log_text)
 
         # Export buttons
@@ -434,9 +661,10 @@ class AbstractTab(QWidget):
         right_panel = QGroupBox(t("results_preview"))
         right_layout = QVBoxLayout()
 
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(3)
-        self.results_table.setHorizontalHeaderLabels(["Title", "Status", "Summary"])
+        self.results_model = AbstractResultsModel(self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
+        self.results_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         right_layout.addWidget(self.results_table)
 
@@ -450,48 +678,83 @@ class AbstractTab(QWidget):
 
         main_layout.addWidget(splitter)
 
+        # (setter, translation key, fallback text) re-applied on language change
+        self._i18n_bindings: List[Tuple[Callable[[str], None], str, str]] = [
+            (self.file_label.setText, "select_file_label", ""),
+            (self.browse_btn.setText, "browse", ""),
+            (self.mode_label.setText, "screening_mode_label", ""),
+            (self.add_mode_btn.setText, "add_mode", ""),
+            (self.delete_mode_btn.setText, "delete_mode", ""),
+            (self.edit_questions_btn.setText, "edit_questions", ""),
+            (self.ai_assist_btn.setText, "ai_mode_assistant_title", "AI Assistant"),
+            (self.verify_checkbox.setText, "enable_verification", ""),
+            (self.workers_label.setText, "concurrent_workers", ""),
+            (self.delay_label.setText, "api_delay_label", "API Delay (s):"),
+            (self.start_btn.setText, "start_screening", ""),
+            (self.stop_btn.setText, "stop_task", ""),
+            (self.stats_btn.setText, "view_statistics", ""),
+            (self.log_label.setText, "log_label", ""),
+            (self.export_csv_btn.setText, "export_csv", ""),
+            (self.export_excel_btn.setText, "export_excel", ""),
+        ]
+
         # Register for language change notifications
         get_i18n().add_observer(self.update_language)
 
+        # Parse the mode list after the first paint instead of blocking construction
+        QTimer.singleShot(0, self._finish_loading_modes)
+
     def update_language(self) -> None:
         """Update UI text when language changes."""
-        self.file_label.setText(t("select_file_label"))
-        self.browse_btn.setText(t("browse"))
-        self.mode_label.setText(t("screening_mode_label"))
-        self.add_mode_btn.setText(t("add_mode"))
-        self.delete_mode_btn.setText(t("delete_mode"))
-        self.edit_questions_btn.setText(t("edit_questions"))
-        self.ai_assist_btn.setText(t("ai_mode_assistant_title") or "AI Assistant")
-        self.verify_checkbox.setText(t("enable_verification"))
-        self.workers_label.setText(t("concurrent_workers"))
-        self.delay_label.setText(t("api_delay_label") or "API Delay (s):")
-        self.start_btn.setText(t("start_screening"))
-        self.stop_btn.setText(t("stop_task"))
-        self.stats_btn.setText(t("view_statistics"))
-        self.log_label.setText(t("log_label"))
-        self.export_csv_btn.setText(t("export_csv"))
-        self.export_excel_btn.setText(t("export_excel"))
+        for set_text, key, fallback in self._i18n_bindings:
+            set_text(t(key) or fallback)
+        self.mode_combo.setPlaceholderText(t(self._mode_placeholder_key))
 
     def _load_modes(self) -> None:
         """Load screening modes from configuration."""
-        questions_path = Path(__file__).resolve().parents[3] / "questions_config.json"
+        questions_path = self._questions_path()
         try:
-            with open(questions_path, 'r', encoding='utf-8') as f:
-                questions = json.load(f)
-            self.mode_options = list(questions.keys())
+            stat = questions_path.stat()
+            self.mode_options = list(_questions_mode_names(str(questions_path), stat.st_mtime_ns, stat.st_size))
         except Exception:
             self.mode_options = []
 
+    def _finish_loading_modes(self) -> None:
+        """Fill the mode combo box from questions_config.json."""
+        self._load_modes()
+        self.mode_model.setStringList(self.mode_options)
+        self._mode_placeholder_key = "no_modes"
+        self.mode_combo.setPlaceholderText(t(self._mode_placeholder_key))
+        if self.mode_options:
+            self.mode_combo.setCurrentIndex(0)
+
+    def _select_mode_option(self, name: str) -> None:
+        """Select a mode in the combo box, appending it first if it is new."""
+        if name not in self.mode_options:
+            self.mode_options.append(name)
+            row = self.mode_model.rowCount()
+            self.mode_model.insertRows(row, 1)
+            self.mode_model.setData(self.mode_model.index(row), name)
+        self.mode_combo.setCurrentIndex(self.mode_options.index(name))
+
     def _browse_file(self) -> None:
-        """Browse for CSV or Excel file."""
+        """Browse for CSV or Excel file, starting in the last used directory."""
+        settings = QSettings("litrx", "litrx")
+        start_dir = settings.value("abstract/last_browse_dir", "", type=str)
+        options = QFileDialog.Option(0)
+        # Qt's own dialog can be faster than the platform one on large mounted filesystems
+        if not self.parent_window.base_config.get("NATIVE_FILE_DIALOG", True):
+            options |= QFileDialog.Option.DontUseNativeDialog
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             t("browse"),
-            "",
-            "CSV or Excel (*.csv *.xlsx)"
+            start_dir,
+            "CSV or Excel (*.csv *.xlsx)",
+            options=options,
         )
         if file_path:
             self.file_entry.setText(file_path)
+            settings.setValue("abstract/last_browse_dir", os.path.dirname(file_path))
 
     def start_screening(self) -> None:
         """Start abstract screening using QThread worker with concurrent processing."""
@@ -508,8 +771,9 @@ class AbstractTab(QWidget):
         self.export_csv_btn.setEnabled(False)
         self.export_excel_btn.setEnabled(False)
         self.progress_bar.setValue(0)
+        self._log_buffer.clear()
         self.log_text.clear()
-        self.results_table.setRowCount(0)
+        self.results_model.clear()
 
         # Get settings from UI
         config = self.parent_window.build_config()
@@ -527,7 +791,8 @@ class AbstractTab(QWidget):
         self.worker.update_progress.connect(self._update_progress)
         self.worker.update_status.connect(self._update_status)
         self.worker.append_log.connect(self._append_log)
-        self.worker.add_result_row.connect(self._add_result_row)
+        self.worker.initialize_results.connect(self.results_model.reset_rows)
+        self.worker.results_ready.connect(self._drain_results)
         self.worker.show_error.connect(self._show_error)
         self.worker.show_info.connect(self._show_info)
         self.worker.enable_export.connect(self._enable_export)
@@ -547,6 +812,7 @@ class AbstractTab(QWidget):
         """Called when worker thread finishes (success or cancelled)."""
         # Copy results from worker to main thread
         if self.worker:
+            self._drain_results()
             self.df = self.worker.df
 
         # Restore button states
@@ -557,13 +823,24 @@ class AbstractTab(QWidget):
             self.worker.deleteLater()
             self.worker = None
 
-    def _add_result_row(self, row: int, title: str, status: str, summary: str) -> None:
-        """Add a result row to the table (must be called from main thread via signal)."""
-        if row >= self.results_table.rowCount():
-            self.results_table.setRowCount(row + 1)
-        self.results_table.setItem(row, 0, QTableWidgetItem(title))
-        self.results_table.setItem(row, 1, QTableWidgetItem(status))
-        self.results_table.setItem(row, 2, QTableWidgetItem(summary))
+    def _drain_results(self) -> None:
+        """Apply all results buffered by the worker in one model and log update."""
+        if not self.worker:
+            return
+        entries = self.worker.take_results()
+        if not entries:
+            return
+
+        self.results_model.set_rows(
+            (row, title, status, summary) for row, _, _, _, title, status, summary in entries
+        )
+
+        # Entries arrive in completion order, so the last one carries the latest progress
+        _, pct, status_text, _, _, _, _ = entries[-1]
+        self.progress_bar.setValue(int(pct))
+        self.status_label.setText(status_text)
+        self._log_buffer.extend(entry[3] for entry in entries)
+        self._schedule_log_flush()
 
     def _update_progress(self, value: float) -> None:
         """Update progress bar."""
@@ -574,8 +851,22 @@ class AbstractTab(QWidget):
         self.status_label.setText(text)
 
     def _append_log(self, text: str) -> None:
-        """Append text to log."""
-        self.log_text.append(text)
+        """Queue text for the log; queued lines are appended together shortly after."""
+        self._log_buffer.append(text)
+        self._schedule_log_flush()
+
+    def _schedule_log_flush(self) -> None:
+        """Arm the log flush timer unless a flush is already scheduled."""
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Append all queued log lines with a single document update."""
+        self._log_flush_pending = False
+        if self._log_buffer:
+            self.log_text.append("\n".join(self._log_buffer))
+            self._log_buffer.clear()
 
     def _show_error(self, title: str, message: str) -> None:
         """Show error message."""
@@ -602,23 +893,33 @@ class AbstractTab(QWidget):
         return resource_path("questions_config.json")
 
     def _resolve_questions_config_write_path(self) -> Path:
-        """Resolve a writable path for questions_config.json (handles frozen apps)."""
-        import os
+        """Resolve a writable path for questions_config.json (handles frozen apps).
+
+        The result is remembered until a write to it fails.
+        """
+        if self._resolved_q_path is not None:
+            return self._resolved_q_path
         # Prefer resource path if writable
         p = self._questions_path()
-        try:
-            os.makedirs(os.path.dirname(str(p)), exist_ok=True)
-            with open(p, 'a', encoding='utf-8'):
+        writable = os.access(p, os.W_OK) if p.exists() else os.access(p.parent, os.W_OK)
+        if not writable:
+            # os.access can be wrong on network shares; fall back to a real probe
+            try:
+                os.makedirs(os.path.dirname(str(p)), exist_ok=True)
+                with open(p, 'a', encoding='utf-8'):
+                    pass
+                writable = True
+            except Exception:
                 pass
-            return p
-        except Exception:
+        if not writable:
             user_dir = os.path.join(os.path.expanduser('~'), '.litrx')
             os.makedirs(user_dir, exist_ok=True)
-            return Path(user_dir) / 'questions_config.json'
+            p = Path(user_dir) / 'questions_config.json'
+        self._resolved_q_path = p
+        return p
 
     def _write_questions_config(self, data: dict, backup: bool = False) -> None:
         # Try writing to packaged location; if fails, write to ~/.litrx/questions_config.json
-        import os, json, time
         target = self._resolve_questions_config_write_path()
         if backup and os.path.exists(target):
             bak = str(target) + f".bak.{int(time.time())}"
@@ -627,13 +928,15 @@ class AbstractTab(QWidget):
                     dst.write(src.read())
             except Exception:
                 pass
-        with open(target, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        try:
+            json_dump_file(data, str(target))
+        except Exception:
+            # Re-resolve on the next save in case writability changed
+            self._resolved_q_path = None
+            raise
 
     def add_mode(self) -> None:
         """Add a new screening mode and persist to questions_config.json."""
-        from PyQt6.QtWidgets import QInputDialog
-
         name, ok = QInputDialog.getText(self, t("new_mode"), t("enter_mode_name"))
         if not ok or not name.strip():
             return
@@ -642,8 +945,7 @@ class AbstractTab(QWidget):
         q_path = self._questions_path()
         try:
             if q_path.exists():
-                with q_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _read_questions_config(q_path)
             else:
                 data = {}
         except Exception:
@@ -661,20 +963,13 @@ class AbstractTab(QWidget):
         }
 
         try:
-            with q_path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            json_dump_file(data, str(q_path))
         except Exception as e:
             QMessageBox.critical(self, t("error"), str(e))
             return
 
-        # Refresh combo
-        self._load_modes()
-        self.mode_combo.clear()
-        self.mode_combo.addItems(self.mode_options)
-        # Select new mode
-        idx = self.mode_combo.findText(name)
-        if idx >= 0:
-            self.mode_combo.setCurrentIndex(idx)
+        # Add to combo and select new mode
+        self._select_mode_option(name)
 
         QMessageBox.information(self, t("success"), t("saved"))
 
@@ -691,8 +986,7 @@ class AbstractTab(QWidget):
         q_path = self._questions_path()
         try:
             if q_path.exists():
-                with q_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _read_questions_config(q_path)
             else:
                 data = {}
         except Exception as e:
@@ -722,16 +1016,16 @@ class AbstractTab(QWidget):
 
             # Save updated config
             try:
-                with q_path.open("w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                json_dump_file(data, str(q_path))
             except Exception as e:
                 QMessageBox.critical(self, t("error"), f"Failed to save: {str(e)}")
                 return
 
-            # Refresh combo box
-            self._load_modes()
-            self.mode_combo.clear()
-            self.mode_combo.addItems(self.mode_options)
+            # Remove from combo box
+            row = self.mode_options.index(mode) if mode in self.mode_options else -1
+            if row >= 0:
+                del self.mode_options[row]
+                self.mode_model.removeRows(row, 1)
 
             # Select first mode if available
             if self.mode_options:
@@ -750,8 +1044,7 @@ class AbstractTab(QWidget):
 
         q_path = self._questions_path()
         try:
-            with q_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_questions_config(q_path)
         except Exception:
             data = {}
 
@@ -768,10 +1061,8 @@ class AbstractTab(QWidget):
         right_col.addWidget(QLabel(t("yes_no_questions")))
         open_list = QListWidget()
         yn_list = QListWidget()
-        for q in mode_data.get("open_questions", []):
-            QListWidgetItem(q.get("question", ""), open_list)
-        for q in mode_data.get("yes_no_questions", []):
-            QListWidgetItem(q.get("question", ""), yn_list)
+        open_list.addItems([str(q.get("question", "")) for q in mode_data.get("open_questions", [])])
+        yn_list.addItems([str(q.get("question", "")) for q in mode_data.get("yes_no_questions", [])])
         left_col.addWidget(open_list)
         right_col.addWidget(yn_list)
         lists_layout.addLayout(left_col)
@@ -906,8 +1197,7 @@ class AbstractTab(QWidget):
                     "open_questions": mode_data.get("open_questions", []),
                     "yes_no_questions": mode_data.get("yes_no_questions", []),
                 }
-                with q_path.open("w", encoding="utf-8") as f:
-                    json.dump(all_data, f, ensure_ascii=False, indent=2)
+                json_dump_file(all_data, str(q_path))
                 QMessageBox.information(dialog, t("success"), t("question_config_saved"))
                 dialog.accept()
             except Exception as e:
@@ -938,11 +1228,9 @@ class AbstractTab(QWidget):
         if dlg.exec() == QDialog.DialogCode.Accepted and dlg.result:
             try:
                 # Load existing config
-                import json
                 q_path = self._questions_path()
                 try:
-                    with open(q_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = _read_questions_config(q_path)
                 except Exception:
                     data = {}
 
@@ -958,37 +1246,12 @@ class AbstractTab(QWidget):
                         slug = slug.replace('__', '_')
                     return slug or 'new_mode'
 
-                if 'mode_name' in mode or 'criteria' in mode or 'questions' in mode:
+                new_schema = 'mode_name' in mode or 'criteria' in mode or 'questions' in mode
+                if new_schema:
                     key = _slugify(mode.get('mode_name', 'new_mode'))
-                    yes_no_questions = []
-                    for it in mode.get('criteria', []) or []:
-                        if isinstance(it, dict):
-                            yes_no_questions.append({
-                                'key': it.get('key', ''),
-                                'question': it.get('question', ''),
-                                'column_name': it.get('column_name', ''),
-                            })
-                    open_questions = []
-                    for it in mode.get('questions', []) or []:
-                        if isinstance(it, dict):
-                            open_questions.append({
-                                'key': it.get('key', ''),
-                                'question': it.get('question', ''),
-                                'column_name': it.get('column_name', ''),
-                            })
-                    legacy_mode = {
-                        'description': mode.get('description', ''),
-                        'yes_no_questions': yes_no_questions,
-                        'open_questions': open_questions,
-                    }
                 else:
                     # Legacy schema path
                     key = mode.get('mode_key', 'new_mode')
-                    legacy_mode = {
-                        'description': mode.get('description', ''),
-                        'yes_no_questions': mode.get('yes_no_questions', []),
-                        'open_questions': mode.get('open_questions', []),
-                    }
                 if key in data:
                     # Custom dialog with localized buttons
                     box = QMessageBox(self)
@@ -1003,10 +1266,13 @@ class AbstractTab(QWidget):
                     if clicked == cancel_btn:
                         return
                     elif clicked == rename_btn:
+                        existing = set(data)
                         suffix = 1
-                        while f"{key}_{suffix}" in data:
+                        candidate = f"{key}_{suffix}"
+                        while candidate in existing:
                             suffix += 1
-                        key = f"{key}_{suffix}"
+                            candidate = f"{key}_{suffix}"
+                        key = candidate
                         mode['mode_key'] = key
                         do_backup = False
                     else:
@@ -1015,15 +1281,30 @@ class AbstractTab(QWidget):
                 else:
                     do_backup = False
 
-                data[key] = legacy_mode
+                # Build the stored mode only once the save is confirmed
+                if new_schema:
+                    def _project(items) -> list:
+                        # Keep only the fields a mode question needs; skip malformed entries
+                        return [
+                            {'key': it.get('key', ''), 'question': it.get('question', ''), 'column_name': it.get('column_name', '')}
+                            for it in items or []
+                            if isinstance(it, dict)
+                        ]
+
+                    yes_no_questions = _project(mode.get('criteria'))
+                    open_questions = _project(mode.get('questions'))
+                else:
+                    yes_no_questions = mode.get('yes_no_questions', [])
+                    open_questions = mode.get('open_questions', [])
+                data[key] = {
+                    'description': mode.get('description', ''),
+                    'yes_no_questions': yes_no_questions,
+                    'open_questions': open_questions,
+                }
                 self._write_questions_config(data, backup=do_backup)
 
                 # refresh combo
-                self._load_modes()
-                self.mode_combo.clear(); self.mode_combo.addItems(self.mode_options)
-                idx = self.mode_combo.findText(key)
-                if idx >= 0:
-                    self.mode_combo.setCurrentIndex(idx)
+                self._select_mode_option(key)
                 QMessageBox.information(self, t("success") or "Success", t("saved") or "Saved")
             except Exception as e:
                 QMessageBox.critical(self, t("error") or "Error", str(e))
@@ -1035,18 +1316,27 @@ class AbstractTab(QWidget):
             return
         # Load questions for mode
         mode = self.mode_combo.currentText().strip()
-        q = load_mode_questions(mode)
-        screener = AbstractScreener(self.parent_window.build_config())
-        stats = screener.generate_statistics(self.df, q.get("open_questions", []), q.get("yes_no_questions", []))
+        q = _mode_questions_for_display(mode)
+        # Counting needs no AI client, so skip building an AbstractScreener
+        stats = compute_screening_statistics(
+            self.df,
+            q.get("open_questions", []),
+            q.get("yes_no_questions", []),
+            verification_enabled=False,
+        )
 
         # Render as simple text
-        lines = [t("statistics_summary", count=stats.get('total_articles', 0))]
-        for qtext, counts in stats.get('yes_no_results', {}).items():
-            lines.append(f"- {qtext}: 是 {counts.get('是', 0)}, 否 {counts.get('否', 0)}, 不确定 {counts.get('不确定', 0)}")
-        for qtext, oc in stats.get('open_question_stats', {}).items():
-            lines.append(f"- {qtext}: answered {oc.get('answered', 0)}, missing {oc.get('missing', 0)}")
+        header = t("statistics_summary", count=stats.get('total_articles', 0))
+        yn_lines = (
+            f"- {qtext}: 是 {counts.get('是', 0)}, 否 {counts.get('否', 0)}, 不确定 {counts.get('不确定', 0)}"
+            for qtext, counts in stats.get('yes_no_results', {}).items()
+        )
+        open_lines = (
+            f"- {qtext}: answered {oc.get('answered', 0)}, missing {oc.get('missing', 0)}"
+            for qtext, oc in stats.get('open_question_stats', {}).items()
+        )
 
-        QMessageBox.information(self, t("screening_statistics"), "\n".join(lines))
+        QMessageBox.information(self, t("screening_statistics"), "\n".join(chain((header,), yn_lines, open_lines)))
 
     def export_csv(self) -> None:
         """Export results to CSV."""
@@ -1061,11 +1351,7 @@ class AbstractTab(QWidget):
             "CSV (*.csv)"
         )
         if file_path:
-            try:
-                self.df.to_csv(file_path, index=False, encoding='utf-8-sig')
-                QMessageBox.information(self, t("success"), t("results_exported"))
-            except Exception as e:
-                QMessageBox.critical(self, t("error"), str(e))
+            self._start_export(file_path, "csv")
 
     def export_excel(self) -> None:
         """Export results to Excel."""
@@ -1080,8 +1366,33 @@ class AbstractTab(QWidget):
             "Excel (*.xlsx)"
         )
         if file_path:
-            try:
-                self.df.to_excel(file_path, index=False)
-                QMessageBox.information(self, t("success"), t("results_exported"))
-            except Exception as e:
-                QMessageBox.critical(self, t("error"), str(e))
+            self._start_export(file_path, "xlsx")
+
+    def _start_export(self, file_path: str, file_type: str) -> None:
+        """Write the results in a background thread."""
+        # Disabled until the write finishes to prevent overlapping exports
+        self.export_csv_btn.setEnabled(False)
+        self.export_excel_btn.setEnabled(False)
+        self.export_worker = AbstractExportWorker(self.df, file_path, file_type)
+        self.export_worker.update_progress.connect(self._update_progress)
+        self.export_worker.export_succeeded.connect(self._on_export_succeeded)
+        self.export_worker.export_failed.connect(self._on_export_failed)
+        self.export_worker.finished.connect(self._on_export_finished)
+        self.export_worker.start()
+
+    def _on_export_succeeded(self) -> None:
+        """Report a finished export (called from main thread)."""
+        QMessageBox.information(self, t("success"), t("results_exported"))
+
+    def _on_export_failed(self, message: str) -> None:
+        """Report a failed export (called from main thread)."""
+        QMessageBox.critical(self, t("error"), message)
+
+    def _on_export_finished(self) -> None:
+        """Called when the export thread finishes (success or failure)."""
+        # A new screening may have started meanwhile; it re-enables export itself
+        if self.worker is None and self.df is not None:
+            self._enable_export()
+        if self.export_worker:
+            self.export_worker.deleteLater()
+            self.export_worker = None
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import os
-from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt, pyqtSignal, QObject, QThread
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QObject, QThread
 from PyQt6.QtWidgets import (
     QFileDialog,
     QHBoxLayout,
@@ -16,8 +17,7 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QProgressBar,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
@@ -25,13 +25,15 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QFont
 
-import pandas as pd
-
-from ...csv_analyzer import LiteratureAnalyzer
+from ...constants import DEFAULT_MAX_WORKERS
+from ...exceptions import FileProcessingError
 from ...i18n import t, get_i18n
 from ...task_manager import CancellableTask, TaskCancelledException
 
 if TYPE_CHECKING:
+    import pandas as pd
+
+    from ...csv_analyzer import LiteratureAnalyzer
     from ..base_window_qt import BaseWindow
 
 
@@ -43,7 +45,7 @@ class CsvAnalysisWorker(QThread):
     """
 
     # Signals for thread-safe communication with main thread
-    update_row = pyqtSignal(int, str, object, str)  # row, title, score, analysis
+    rows_ready = pyqtSignal()  # buffered rows are waiting in take_rows()
     update_progress = pyqtSignal(float)  # progress percentage
     show_error = pyqtSignal(str, str)  # title, message
     show_info = pyqtSignal(str, str)  # title, message
@@ -67,52 +69,112 @@ class CsvAnalysisWorker(QThread):
         self.df: Optional[pd.DataFrame] = None
         self.analyzer: Optional[LiteratureAnalyzer] = None
 
+        # Finished rows (row, title, score, summary, full analysis) waiting for
+        # the GUI thread; at most one rows_ready signal is queued at a time
+        self._row_buffer: Deque[Tuple[int, str, Any, str, Optional[str]]] = deque()
+        self._row_lock = threading.Lock()
+        self._drain_pending = False
+
+        # Progress state, updated only from the worker thread
+        self._total = 0
+        self._completed = 0
+        self._last_pct = -1
+        self._error_tpl = ""
+
     def run(self) -> None:
         """Run the analysis (executed in background thread)."""
-        analyzer = LiteratureAnalyzer(self.config, self.topic)
+        # pandas and the analyzer (which pulls in the AI client) are only
+        # imported once an analysis actually runs, keeping GUI startup light
+        import pandas as pd
 
-        try:
-            df = analyzer.read_scopus_csv(self.path)
-        except Exception as e:
-            self.show_error.emit(t("error"), t("error_read_file", error=str(e)))
-            self.finished_processing.emit()
-            return
+        from ...csv_analyzer import LiteratureAnalyzer
 
-        self.df = df
-        self.analyzer = analyzer
-        total = len(df)
+        processed_chunks: List[pd.DataFrame] = []
 
+        # Every exit, including setup failures, goes through the handlers
+        # and the finally block below, which emit the matching signals.
         try:
-            # Process all papers with cancellation checks
-            for i, (idx, row) in enumerate(df.iterrows(), start=1):
-                # Check for cancellation
-                if self.task and self.task.is_cancelled():
-                    self.show_info.emit(t("hint"), t("task_stopped"))
-                    break
-
-                try:
-                    res = analyzer.analyze_paper(row['Title'], row['Abstract'])
-                    analyzer.apply_result_to_dataframe(df, idx, res)
-
-                    summary = res['analysis'].replace('\n', ' ')[:80]
-                    self.update_row.emit(i - 1, row['Title'], res['relevance_score'], summary)
-
-                except Exception as e:
-                    error_msg = t("error_analysis", error=str(e))
-                    self.update_row.emit(i - 1, row['Title'], '', error_msg)
-
-                # Update progress bar
-                self.update_progress.emit(i / total * 100)
+            analyzer = LiteratureAnalyzer(self.config, self.topic)
+            total = analyzer.count_csv_rows(self.path)
+            self.analyzer = analyzer
+
+            # Papers are analyzed concurrently; results are applied to the
+            # DataFrame here, in the worker thread, as each request completes.
+            # The CSV is streamed in chunks so analysis starts as soon as the
+            # first chunk is parsed.
+            max_workers = self.config.get('MAX_WORKERS', DEFAULT_MAX_WORKERS)
+            # Requests are submitted in small batches so finished results are
+            # handled while the rest of the chunk is still being scheduled
+            max_in_flight = max_workers * 2
+            self._total = total
+            pos = 0
+            # Translated texts used per row are looked up once per run
+            self._error_tpl = t("error_analysis")
+            skipped_text = t("skipped_missing_abstract")
+            task = self.task
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                if self.task:
+                    # Lets CancellableTask.cancel() drop pending requests
+                    self.task.executor = executor
+                    self.task.start()
+
+                for df in analyzer.iter_scopus_chunks(self.path):
+                    processed_chunks.append(df)
+
+                    # Results are collected and written to the chunk in a
+                    # single assignment once its requests have finished.
+                    done_indices: List = []
+                    done_values: List = []
+                    pending: Dict = {}
+
+                    # Rows without a usable title/abstract are reported as
+                    # skipped up front instead of being scheduled.
+                    valid = analyzer.valid_rows_mask(df).to_numpy()
+                    for i, (is_valid, (idx, row)) in enumerate(zip(valid, df.iterrows())):
+                        # Polled every 8 rows; scheduling is cheap, and
+                        # cancel() also drops requests already queued
+                        if (i & 7) == 0 and task is not None and task.is_cancelled():
+                            break
+                        if not is_valid:
+                            title = row['Title'] if pd.notna(row['Title']) else ''
+                            self._queue_row(pos, str(title), '', skipped_text, None)
+                            self._advance_progress()
+                            pos += 1
+                            continue
+                        try:
+                            future = executor.submit(analyzer.analyze_paper, row['Title'], row['Abstract'])
+                        except RuntimeError:
+                            # Executor was shut down by a concurrent cancel()
+                            break
+                        pending[future] = (pos, idx, row['Title'])
+                        pos += 1
+                        if len(pending) >= max_in_flight:
+                            self._collect_finished(analyzer, pending, done_indices, done_values)
+
+                    while pending:
+                        # Check for cancellation
+                        if self.task and self.task.is_cancelled():
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            break
+                        self._collect_finished(analyzer, pending, done_indices, done_values)
+
+                    analyzer.apply_results_to_dataframe(df, done_indices, done_values)
+
+                    if self.task and self.task.is_cancelled():
+                        self.show_info.emit(t("hint"), t("task_stopped"))
+                        break
+
+            df = processed_chunks[0] if len(processed_chunks) == 1 else pd.concat(processed_chunks)
+            self.df = df
 
             # Enable export button when done (only if not cancelled)
             if not (self.task and self.task.is_cancelled()):
+                # Skipped rows at the end of the file do not report progress
+                self.update_progress.emit(100)
+
                 # Auto-save results beside the input CSV with timestamped name
                 try:
-                    file_dir = os.path.dirname(self.path)
-                    file_name = os.path.splitext(os.path.basename(self.path))[0]
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    out_path = os.path.join(file_dir, f"{file_name}_analyzed_{timestamp}.csv")
-                    df.to_csv(out_path, index=False, encoding='utf-8-sig')
+                    out_path = analyzer.save_results(df, self.path)
                     self.show_info.emit(t("success"), t("complete_saved", path=out_path))
                 except Exception as e:
                     self.show_error.emit(t("error"), str(e))
@@ -121,12 +183,179 @@ class CsvAnalysisWorker(QThread):
         except TaskCancelledException:
             self.show_info.emit(t("hint"), t("task_stopped"))
 
+        except FileProcessingError as e:
+            self.show_error.emit(t("error"), t("error_read_file", error=str(e)))
+
         except Exception as e:
             self.show_error.emit(t("error"), t("error_analysis", error=str(e)))
 
         finally:
+            if self.df is None and processed_chunks:
+                # Keep partial results after cancellation or errors
+                self.df = pd.concat(processed_chunks)
+            if self.task:
+                self.task.finish()
             self.finished_processing.emit()
 
+    def _collect_finished(self, analyzer: LiteratureAnalyzer, pending: Dict, done_indices: List, done_values: List) -> None:
+        """Wait for at least one pending request and handle every finished one.
+
+        Finished futures are removed from ``pending``; successful results are
+        appended to ``done_indices``/``done_values`` for a batched DataFrame
+        update, and each row is emitted to the table. Requests cancelled by
+        Stop are dropped without a row or progress step.
+        """
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            row_pos, idx, title = pending.pop(future)
+            if future.cancelled():
+                # Dropped by Stop before it started: neither a result nor an error
+                continue
+            try:
+                res = future.result()
+                done_values.append(analyzer.result_values(res))
+                done_indices.append(idx)
+
+                # Slice before replacing: same text, without
+                # scanning the full analysis for newlines
+                summary = res['analysis'][:80].replace('\n', ' ')
+                self._queue_row(row_pos, title, res['relevance_score'], summary, res['analysis'])
+
+            except Exception as e:
+                self._queue_row(row_pos, title, '', self._error_tpl.format(error=e), None)
+
+            self._advance_progress()
+
+    def _queue_row(self, row: int, title: str, score: Any, summary: str, analysis: Optional[str]) -> None:
+        """Buffer a finished row, signalling the GUI only if no drain is pending."""
+        self._row_buffer.append((row, title, score, summary, analysis))
+        with self._row_lock:
+            if self._drain_pending:
+                return
+            self._drain_pending = True
+        self.rows_ready.emit()
+
+    def take_rows(self) -> List[Tuple[int, str, Any, str, Optional[str]]]:
+        """Return and clear all buffered rows (called from main thread)."""
+        with self._row_lock:
+            self._drain_pending = False
+        rows = []
+        while self._row_buffer:
+            rows.append(self._row_buffer.popleft())
+        return rows
+
+    def _advance_progress(self) -> None:
+        """Count one finished row; emit progress only when the whole percentage changes."""
+        self._completed += 1
+        pct = self._completed * 100 // max(self._total, 1)
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.update_progress.emit(pct)
+
+
+class CsvExportWorker(QThread):
+    """Worker thread that writes analysis results to disk.
+
+    Large frames take seconds to serialize, so the write runs off the GUI
+    thread and reports back through signals.
+    """
+
+    export_succeeded = pyqtSignal()
+    export_failed = pyqtSignal(str)  # error message
+
+    def __init__(self, analyzer: LiteratureAnalyzer, df: pd.DataFrame, path: str):
+        """Initialize the worker.
+
+        Args:
+            analyzer: Analyzer whose save_results() writes the file
+            df: Results to export
+            path: Path chosen in the save dialog
+        """
+        super().__init__()
+        self.analyzer = analyzer
+        self.df = df
+        self.path = path
+
+    def run(self) -> None:
+        """Write the results (executed in background thread)."""
+        try:
+            self.analyzer.save_results(self.df, self.path)
+        except Exception as e:
+            self.export_failed.emit(str(e))
+        else:
+            self.export_succeeded.emit()
+
+
+class CsvResultsModel(QAbstractTableModel):
+    """Table model for CSV analysis rows.
+
+    Each column is kept in its own list (titles, scores, summaries) and the
+    view only asks for the cells it is currently painting, so large result
+    sets do not create one widget item per cell. The full analysis text of
+    each row is kept alongside for the detail dialog.
+    """
+
+    COLUMN_COUNT = 3
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._titles: List[str] = []
+        self._scores: List[str] = []
+        self._summaries: List[str] = []
+        self._analyses: List[Optional[str]] = []
+        self._headers: List[str] = [""] * self.COLUMN_COUNT
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._titles)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            column = (self._titles, self._scores, self._summaries)[index.column()]
+            return column[index.row()]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):  # noqa: N802
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def set_headers(self, headers: List[str]) -> None:
+        """Set the column header labels."""
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, self.COLUMN_COUNT - 1)
+
+    def set_row(self, row: int, title: str, score: str, summary: str, analysis: Optional[str] = None) -> None:
+        """Set a row's values, growing the model with empty rows if needed."""
+        if row >= len(self._titles):
+            added = row + 1 - len(self._titles)
+            self.beginInsertRows(QModelIndex(), len(self._titles), row)
+            self._titles.extend([""] * added)
+            self._scores.extend([""] * added)
+            self._summaries.extend([""] * added)
+            self._analyses.extend([None] * added)
+            self.endInsertRows()
+        self._titles[row] = title
+        self._scores[row] = score
+        self._summaries[row] = summary
+        self._analyses[row] = analysis
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.COLUMN_COUNT - 1))
+
+    def row_detail(self, row: int) -> Tuple[str, Optional[str]]:
+        """Return the title and full analysis text (None if not analyzed) of a row."""
+        return self._titles[row], self._analyses[row]
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.beginResetModel()
+        self._titles = []
+        self._scores = []
+        self._summaries = []
+        self._analyses = []
+        self.endResetModel()
+
 
 class CsvTab(QWidget):
     """Tab for CSV relevance analysis."""
@@ -137,6 +366,7 @@ class CsvTab(QWidget):
 
         # Worker thread and task management
         self.worker: Optional[CsvAnalysisWorker] = None
+        self.export_worker: Optional[CsvExportWorker] = None
         self.current_task: Optional[CancellableTask] = None
         self.df: Optional[pd.DataFrame] = None
         self.analyzer: Optional[LiteratureAnalyzer] = None
@@ -187,9 +417,11 @@ class CsvTab(QWidget):
         layout.addWidget(self.progress_bar)
 
         # Results table
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels([t("table_title"), t("table_score"), t("table_analysis")])
+        self.table_model = CsvResultsModel(self)
+        self.table_model.set_headers([t("table_title"), t("table_score"), t("table_analysis")])
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
         self.table.setColumnWidth(1, 100)
@@ -214,7 +446,7 @@ class CsvTab(QWidget):
         self.start_btn.setText(t("start_analysis"))
         self.stop_btn.setText(t("stop_task"))
         self.export_btn.setText(t("export_results"))
-        self.table.setHorizontalHeaderLabels([t("table_title"), t("table_score"), t("table_analysis")])
+        self.table_model.set_headers([t("table_title"), t("table_score"), t("table_analysis")])
 
     def _browse_file(self) -> None:
         """Browse for CSV file."""
@@ -240,7 +472,7 @@ class CsvTab(QWidget):
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.progress_bar.setValue(0)
-        self.table.setRowCount(0)
+        self.table_model.clear()
         self.df = None
         self.analyzer = None
 
@@ -252,7 +484,7 @@ class CsvTab(QWidget):
         self.worker = CsvAnalysisWorker(config, path, topic, self.current_task)
 
         # Connect worker signals to UI update slots
-        self.worker.update_row.connect(self._update_row)
+        self.worker.rows_ready.connect(self._drain_rows)
         self.worker.update_progress.connect(self._update_progress)
         self.worker.show_error.connect(self._show_error)
         self.worker.show_info.connect(self._show_info)
@@ -285,14 +517,12 @@ class CsvTab(QWidget):
             self.worker.deleteLater()
             self.worker = None
 
-    def _update_row(self, row: int, title: str, score, analysis: str) -> None:
-        """Update a row in the table (called from main thread)."""
-        if row >= self.table.rowCount():
-            self.table.setRowCount(row + 1)
-
-        self.table.setItem(row, 0, QTableWidgetItem(title))
-        self.table.setItem(row, 1, QTableWidgetItem(str(score)))
-        self.table.setItem(row, 2, QTableWidgetItem(analysis))
+    def _drain_rows(self) -> None:
+        """Move all rows buffered by the worker into the table (called from main thread)."""
+        if not self.worker:
+            return
+        for row, title, score, summary, analysis in self.worker.take_rows():
+            self.table_model.set_row(row, title, str(score), summary, analysis)
 
     def _update_progress(self, value: float) -> None:
         """Update progress bar (called from main thread)."""
@@ -317,18 +547,15 @@ class CsvTab(QWidget):
 
     def show_full_analysis(self) -> None:
         """Show full analysis in a dialog when row is double-clicked."""
-        current_row = self.table.currentRow()
-        if current_row < 0 or self.df is None:
+        current_row = self.table.currentIndex().row()
+        if current_row < 0:
             return
 
         try:
-            idx = self.df.index[current_row]
-            analysis = self.df.at[idx, 'Analysis Result']
-            if pd.isna(analysis):
+            title, analysis = self.table_model.row_detail(current_row)
+            if analysis is None:
                 return
 
-            title = self.df.at[idx, 'Title']
-
             # Create dialog
             dialog = QDialog(self)
             dialog.setWindowTitle(title)
@@ -363,8 +590,27 @@ class CsvTab(QWidget):
             f"{t('csv_files')} (*.csv)"
         )
         if file_path:
-            try:
-                self.analyzer.save_results(self.df, file_path)
-                QMessageBox.information(self, t("success"), t("results_exported"))
-            except Exception as e:
-                QMessageBox.critical(self, t("error"), str(e))
+            # Disabled until the write finishes to prevent overlapping exports
+            self.export_btn.setEnabled(False)
+            self.export_worker = CsvExportWorker(self.analyzer, self.df, file_path)
+            self.export_worker.export_succeeded.connect(self._on_export_succeeded)
+            self.export_worker.export_failed.connect(self._on_export_failed)
+            self.export_worker.finished.connect(self._on_export_finished)
+            self.export_worker.start()
+
+    def _on_export_succeeded(self) -> None:
+        """Report a finished export (called from main thread)."""
+        self._show_info(t("success"), t("results_exported"))
+
+    def _on_export_failed(self, message: str) -> None:
+        """Report a failed export (called from main thread)."""
+        self._show_error(t("error"), message)
+
+    def _on_export_finished(self) -> None:
+        """Called when the export thread finishes (success or failure)."""
+        # A new analysis may have started meanwhile; it re-enables export itself
+        if self.worker is None:
+            self.export_btn.setEnabled(self.df is not None)
+        if self.export_worker:
+            self.export_worker.deleteLater()
+            self.export_worker = None
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import threading
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal, QThread
+from PyQt6.QtCore import pyqtSignal, QThread
 from PyQt6.QtWidgets import (
     QDialog,
     QFileDialog,
@@ -25,17 +25,10 @@ from PyQt6.QtWidgets import (
     QComboBox,
 )
 
-import pandas as pd
-import yaml
-
-from ...matrix_analyzer import (
-    load_matrix_config,
-    process_literature_matrix,
-    save_results,
-)
 from ...i18n import get_i18n, t
 from ...logging_config import get_logger
 from ...preset_manager import MatrixPresetManager
+from ...utils import yaml_safe_dump, yaml_safe_load
 from ..dialogs_qt.ai_matrix_assistant_qt import AIMatrixAssistantDialog
 from ..dialogs_qt.dimensions_editor_qt_v2 import DimensionsEditorDialog
 
@@ -55,6 +48,7 @@ class MatrixAnalysisWorker(QThread):
     # Signals for thread-safe communication with main thread
     update_progress = pyqtSignal(float)  # progress percentage
     append_log = pyqtSignal(str)  # log text to append
+    logs_ready = pyqtSignal()  # buffered per-PDF status lines are waiting in take_logs()
     show_error = pyqtSignal(str, str)  # title, message
     show_info = pyqtSignal(str, str)  # title, message
     finished_processing = pyqtSignal()  # Emitted when done (success or cancelled)
@@ -84,6 +78,13 @@ class MatrixAnalysisWorker(QThread):
         self.matrix_config = matrix_config
         self.stop_event = threading.Event()
 
+        # Per-PDF status lines reported from the analysis thread pool; at most
+        # one logs_ready signal is queued at a time
+        self._log_buffer: Deque[str] = deque()
+        self._log_lock = threading.Lock()
+        self._drain_pending = False
+        self._last_pct = -1
+
     def stop(self) -> None:
         """Request the worker to stop processing."""
         self.stop_event.set()
@@ -91,6 +92,10 @@ class MatrixAnalysisWorker(QThread):
 
     def run(self) -> None:
         """Run the matrix analysis (executed in background thread)."""
+        # The analyzer pulls in pandas, pypdf and the AI client; it is only
+        # imported once an analysis actually runs, keeping GUI startup light
+        from ...matrix_analyzer import process_literature_matrix, save_results
+
         try:
             self.append_log.emit("开始矩阵分析...")
 
@@ -146,13 +151,33 @@ class MatrixAnalysisWorker(QThread):
             self.finished_processing.emit()
 
     def _progress_callback(self, current: int, total: int) -> None:
-        """Progress callback for matrix analysis (called from worker thread)."""
-        progress = (current / total * 100) if total > 0 else 0
-        self.update_progress.emit(progress)
+        """Progress callback for matrix analysis (called from worker thread).
+
+        Emits only when the whole percentage changes, since the bar shows
+        integer values anyway.
+        """
+        pct = current * 100 // total if total > 0 else 0
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self.update_progress.emit(pct)
 
     def _status_callback(self, pdf_name: str, status: str) -> None:
-        """Status callback for individual PDF processing."""
-        self.append_log.emit(f"[{pdf_name}] {status}")
+        """Status callback for individual PDF processing (called from pool threads)."""
+        self._log_buffer.append(f"[{pdf_name}] {status}")
+        with self._log_lock:
+            if self._drain_pending:
+                return
+            self._drain_pending = True
+        self.logs_ready.emit()
+
+    def take_logs(self) -> List[str]:
+        """Return and clear all buffered status lines (called from main thread)."""
+        with self._log_lock:
+            self._drain_pending = False
+        lines = []
+        while self._log_buffer:
+            lines.append(self._log_buffer.popleft())
+        return lines
 
 
 class MatrixTab(QWidget):
@@ -594,7 +619,7 @@ class MatrixTab(QWidget):
         try:
             # Load config from file
             with open(file_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml_safe_load(f)
 
             # Update current config
             self.matrix_config = config
@@ -624,7 +649,7 @@ class MatrixTab(QWidget):
 
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
-                yaml.safe_dump(self.matrix_config, f, allow_unicode=True, sort_keys=False)
+                yaml_safe_dump(self.matrix_config, f, allow_unicode=True, sort_keys=False)
 
             QMessageBox.information(self, t("success"), t("scheme_saved"))
 
@@ -763,6 +788,7 @@ class MatrixTab(QWidget):
         # Connect worker signals to UI update slots
         self.worker.update_progress.connect(self._update_progress)
         self.worker.append_log.connect(self._append_log)
+        self.worker.logs_ready.connect(self._drain_logs)
         self.worker.show_error.connect(self._show_error)
         self.worker.show_info.connect(self._show_info)
         self.worker.finished_processing.connect(self._on_worker_finished)
@@ -795,6 +821,14 @@ class MatrixTab(QWidget):
         """Append text to log."""
         self.log_text.append(text)
 
+    def _drain_logs(self) -> None:
+        """Append all status lines buffered by the worker in one update."""
+        if not self.worker:
+            return
+        lines = self.worker.take_logs()
+        if lines:
+            self.log_text.append("\n".join(lines))
+
     def _show_error(self, title: str, message: str) -> None:
         """Show error message."""
         QMessageBox.critical(self, title, message)
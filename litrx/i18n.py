@@ -186,6 +186,8 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "open_questions": "开放问题",
         "yes_no_questions": "是/否问题",
         "please_select_mode": "请先选择一个模式后再保存。",
+        "loading_modes": "正在加载模式…",
+        "no_modes": "暂无模式，请添加模式",
         "save_question_config_failed": "保存问题配置失败: {error}",
         "question_config_saved": "问题配置已保存。",
         "cannot_read_file": "无法读取文件: {error}",
@@ -205,6 +207,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "error_read_file": "读取文件失败: {error}",
         "error_no_results": "没有可导出的结果",
         "error_analysis": "错误 {error}",
+        "skipped_missing_abstract": "已跳过：标题或摘要缺失",
 
         # AI Client error messages
         "error_openai_key_missing": "OpenAI API密钥未配置。请在环境变量、.env文件或配置文件中设置OPENAI_API_KEY。",
@@ -398,6 +401,8 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "open_questions": "Open Questions",
         "yes_no_questions": "Yes/No Questions",
         "please_select_mode": "Please select a mode before saving.",
+        "loading_modes": "Loading modes…",
+        "no_modes": "No modes yet, add one",
         "save_question_config_failed": "Failed to save question config: {error}",
         "question_config_saved": "Question configuration saved.",
         "cannot_read_file": "Cannot read file: {error}",
@@ -473,6 +478,7 @@ TRANSLATIONS: Dict[str, Dict[str, str]] = {
         "error_read_file": "Failed to read file: {error}",
         "error_no_results": "No results to export",
         "error_analysis": "Error {error}",
+        "skipped_missing_abstract": "Skipped: missing title or abstract",
 
         # AI Client error messages
         "error_openai_key_missing": "OpenAI API key is not configured. Please set OPENAI_API_KEY in environment variables, .env file, or config file.",
@@ -558,6 +564,8 @@ class I18n:
             default_language: Default language code ('zh' or 'en')
         """
         self._current_language = default_language
+        # Translation table for the current language, rebound on change
+        self._strings: Dict[str, str] = TRANSLATIONS.get(default_language, {})
         self._observers: List[Callable[[], None]] = []
 
     @property
@@ -577,6 +585,7 @@ class I18n:
             raise ValueError(f"Unsupported language: {lang}")
 
         self._current_language = lang
+        self._strings = TRANSLATIONS[lang]
         self._notify_observers()
 
     def get(self, key: str, **kwargs) -> str:
@@ -590,7 +599,7 @@ class I18n:
         Returns:
             Translated text
         """
-        text = TRANSLATIONS.get(self._current_language, {}).get(key, key)
+        text = self._strings.get(key, key)
         if kwargs:
             try:
                 return text.format(**kwargs)
@@ -31,7 +31,6 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import yaml
 import openpyxl  # noqa: F401
 import pandas as pd
 from tqdm import tqdm
@@ -54,7 +53,15 @@ from .exceptions import FileProcessingError
 from .i18n import t
 from .logging_config import get_logger
 from .progress_manager import ProgressManager
-from .utils import AIResponseParser
+from .utils import (
+    PYARROW_AVAILABLE,
+    AIResponseParser,
+    list_pdf_files,
+    read_csv_fast,
+    read_excel_fast,
+    write_excel_fast,
+    yaml_safe_load,
+)
 from .resources import resource_path
 from .token_tracker import TokenUsageTracker
 
@@ -99,7 +106,7 @@ def load_matrix_config(config_path: Optional[str] = None) -> Dict[str, Any]:
         config_path = resource_path("configs", "matrix", "default.yaml")
 
     with open(config_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f) or {}
+        return yaml_safe_load(f) or {}
 
 
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
@@ -156,11 +163,11 @@ def get_ai_response(
     """
     pdf_text = extract_pdf_text(pdf_path)
     pdf_filename = os.path.basename(pdf_path)
+    # Use first 1000 chars of PDF text as abstract for cache key
+    pdf_preview = pdf_text[:1000]
 
     # Try to get cached result
     if cache:
-        # Use first 1000 chars of PDF text as abstract for cache key
-        pdf_preview = pdf_text[:1000] if len(pdf_text) > 1000 else pdf_text
         cached_result = cache.get(
             title=pdf_filename,
             abstract=pdf_preview,
@@ -188,13 +195,11 @@ def get_ai_response(
 
         # Cache the result
         if cache:
-            pdf_preview = pdf_text[:1000] if len(pdf_text) > 1000 else pdf_text
             cache.set(
                 title=pdf_filename,
                 abstract=pdf_preview,
                 questions=prompt[:500],
                 result={"content": content},
-                metadata={"pdf_path": pdf_path}
             )
             logger.debug(f"Cached result for {pdf_filename}")
 
@@ -207,6 +212,25 @@ def get_ai_response(
 # Intelligent Metadata Matching
 # ---------------------------------------------------------------------------
 
+# Metadata columns consulted by match_pdf_to_metadata
+MATCH_COLUMNS = ['DOI', 'Title', 'Key', 'Author', 'Year']
+
+# Year component of a Zotero-style filename (compiled once, used per part)
+_YEAR_PART_RE = re.compile(r'^\d{4}$')
+
+
+def read_metadata_file(metadata_path: str) -> pd.DataFrame:
+    """Read a metadata export (CSV or XLSX) into a DataFrame.
+
+    CSV files are parsed with the multithreaded pyarrow engine and Excel
+    files with calamine when those are installed, falling back to pandas'
+    default readers.
+    """
+    if metadata_path.lower().endswith('.csv'):
+        return read_csv_fast(metadata_path, encoding='utf-8-sig')
+    return read_excel_fast(metadata_path)
+
+
 def parse_zotero_filename(filename: str) -> Dict[str, str]:
     """Parse Zotero-style filename: Author_Year_Title.pdf
 
@@ -225,7 +249,7 @@ def parse_zotero_filename(filename: str) -> Dict[str, str]:
         # Try to identify year (4 digits)
         year_idx = None
         for i, part in enumerate(parts):
-            if re.match(r'^\d{4}$', part):
+            if _YEAR_PART_RE.match(part):
                 year_idx = i
                 break
 
@@ -259,45 +283,91 @@ def calculate_title_similarity(title1: str, title2: str) -> float:
         return 0.0
 
 
+def prepare_match_columns(metadata_df: pd.DataFrame) -> Dict[str, List[Tuple[Any, Any]]]:
+    """Normalize the metadata values consulted by match_pdf_to_metadata once.
+
+    Each entry holds ``(index, value)`` pairs, in row order, for the rows that
+    can match at that priority level, so matching many PDFs lowercases and
+    filters the metadata a single time instead of once per PDF.
+
+    Returns:
+        Dict with any of the keys 'doi', 'title', 'key' (lowercased values),
+        'fuzzy_title' (lowercased, stripped titles) and 'author_year'
+        (``(author, first author token, year)`` tuples)
+    """
+    prepared: Dict[str, List[Tuple[Any, Any]]] = {}
+
+    for column, name in (('DOI', 'doi'), ('Title', 'title'), ('Key', 'key')):
+        if column in metadata_df.columns:
+            lowered = metadata_df[column].fillna('').astype(str).str.lower()
+            prepared[name] = [(idx, v) for idx, v in lowered.items() if v and v != 'nan']
+
+    if 'Title' in metadata_df.columns:
+        prepared['fuzzy_title'] = [
+            (idx, str(title).lower().strip())
+            for idx, title in metadata_df['Title'].items()
+            if pd.notna(title)
+        ]
+
+    # Filename parsing needs both an author and a year on the row
+    if 'Author' in metadata_df.columns and 'Year' in metadata_df.columns:
+        author_year = []
+        for idx, author, year in zip(metadata_df.index, metadata_df['Author'], metadata_df['Year']):
+            if pd.notna(author) and pd.notna(year):
+                author = str(author).lower()
+                tokens = author.split()
+                author_year.append((idx, (author, tokens[0] if tokens else None, str(year))))
+        prepared['author_year'] = author_year
+
+    return prepared
+
+
 def match_pdf_to_metadata(
     pdf_filename: str,
     metadata_df: pd.DataFrame,
     id_columns: List[str],
     title_threshold: float = 80.0,
     enable_filename_parsing: bool = True,
+    prepared: Optional[Dict[str, List[Tuple[Any, Any]]]] = None,
 ) -> Tuple[Optional[int], str, float]:
     """Match a single PDF to metadata row.
 
+    Args:
+        prepared: Output of prepare_match_columns(metadata_df); computed here
+            when omitted, pass it in when matching many PDFs
+
     Returns:
         Tuple of (matched_index, match_type, confidence)
         - matched_index: DataFrame index of matched row, or None
         - match_type: 'doi'|'title_exact'|'title_fuzzy'|'filename_parsed'|'not_matched'
         - confidence: 0-100
     """
+    if prepared is None:
+        prepared = prepare_match_columns(metadata_df)
+
     pdf_lower = pdf_filename.lower()
 
     # Priority 1: DOI exact match
-    if 'DOI' in id_columns and 'DOI' in metadata_df.columns:
-        doi_series = metadata_df['DOI'].astype(str).str.lower()
-        for idx, doi in doi_series.items():
-            if doi and doi != 'nan' and doi in pdf_lower:
+    if 'DOI' in id_columns and 'doi' in prepared:
+        for idx, doi in prepared['doi']:
+            if doi in pdf_lower:
                 return idx, 'doi', 100.0
 
     # Priority 2: Title exact substring match
-    if 'Title' in id_columns and 'Title' in metadata_df.columns:
-        title_series = metadata_df['Title'].astype(str).str.lower()
-        for idx, title in title_series.items():
-            if title and title != 'nan' and title in pdf_lower:
+    if 'Title' in id_columns and 'title' in prepared:
+        for idx, title in prepared['title']:
+            if title in pdf_lower:
                 return idx, 'title_exact', 95.0
 
     # Priority 3: Fuzzy title matching
-    if 'Title' in metadata_df.columns and fuzz:
+    pdf_title = pdf_lower.strip()
+    if 'fuzzy_title' in prepared and fuzz and pdf_title:
         best_match_idx = None
         best_similarity = 0.0
 
-        for idx, title in metadata_df['Title'].items():
-            if pd.notna(title):
-                similarity = calculate_title_similarity(str(title), pdf_filename)
+        for idx, title in prepared['fuzzy_title']:
+            if title:
+                similarity = fuzz.ratio(title, pdf_title)
                 if similarity > best_similarity:
                     best_similarity = similarity
                     best_match_idx = idx
@@ -306,34 +376,21 @@ def match_pdf_to_metadata(
             return best_match_idx, 'title_fuzzy', best_similarity
 
     # Priority 4: Parse filename and match components
-    if enable_filename_parsing:
+    if enable_filename_parsing and 'author_year' in prepared:
         parsed = parse_zotero_filename(pdf_filename)
         if parsed:
             # Try to match by author + year
-            for idx, row in metadata_df.iterrows():
-                author_match = False
-                year_match = False
-
-                # Check author
-                if 'Author' in metadata_df.columns and pd.notna(row.get('Author')):
-                    author = str(row['Author']).lower()
-                    if parsed['author'] in author or author.split()[0] in parsed['author']:
-                        author_match = True
-
-                # Check year
-                if 'Year' in metadata_df.columns and pd.notna(row.get('Year')):
-                    year = str(row['Year'])
-                    if parsed['year'] == year:
-                        year_match = True
-
-                if author_match and year_match:
+            for idx, (author, first_token, year) in prepared['author_year']:
+                author_match = parsed['author'] in author or (
+                    first_token is not None and first_token in parsed['author']
+                )
+                if author_match and parsed['year'] == year:
                     return idx, 'filename_parsed', 70.0
 
     # Priority 5: Zotero Key match
-    if 'Key' in id_columns and 'Key' in metadata_df.columns:
-        key_series = metadata_df['Key'].astype(str).str.lower()
-        for idx, key in key_series.items():
-            if key and key != 'nan' and key in pdf_lower:
+    if 'Key' in id_columns and 'key' in prepared:
+        for idx, key in prepared['key']:
+            if key in pdf_lower:
                 return idx, 'key', 90.0
 
     return None, 'not_matched', 0.0
@@ -358,11 +415,17 @@ def build_pdf_metadata_mapping(
     title_threshold = matching_config.get('title_similarity_threshold', TITLE_SIMILARITY_THRESHOLD)
     enable_parsing = matching_config.get('enable_filename_parsing', True)
 
+    # Matching only reads these columns; they are normalized once for all
+    # PDFs while matched rows are still taken from the full metadata
+    match_columns = [c for c in MATCH_COLUMNS if c in metadata_df.columns]
+    match_df = metadata_df[match_columns]
+    prepared = prepare_match_columns(match_df)
+
     mapping_rows = []
 
     for pdf in pdf_files:
         matched_idx, match_type, confidence = match_pdf_to_metadata(
-            pdf, metadata_df, id_columns, title_threshold, enable_parsing
+            pdf, match_df, id_columns, title_threshold, enable_parsing, prepared
         )
 
         if matched_idx is not None:
@@ -650,6 +713,14 @@ def process_literature_matrix(
         - results_df: Final combined results
         - mapping_df: PDF to metadata mapping (if metadata provided)
     """
+    # Metadata is parsed in the background while the client, cache and
+    # folder scan are set up; the pool accepts no further work
+    metadata_future = None
+    if metadata_path:
+        io_pool = ThreadPoolExecutor(max_workers=1)
+        metadata_future = io_pool.submit(read_metadata_file, metadata_path)
+        io_pool.shutdown(wait=False)
+
     # Initialize AI client and token tracker
     client = AIClient(app_config)
     token_tracker = TokenUsageTracker()
@@ -662,7 +733,7 @@ def process_literature_matrix(
         logger.info(f"Result caching enabled (TTL: {cache_ttl} days)")
 
     # Get PDF files
-    pdf_files = [f for f in os.listdir(pdf_folder) if f.lower().endswith('.pdf')]
+    pdf_files = list_pdf_files(pdf_folder)
     if not pdf_files:
         raise ValueError("在指定文件夹中未找到PDF文件")
 
@@ -672,21 +743,16 @@ def process_literature_matrix(
     metadata_df = None
     mapping_df = None
     metadata_dict = {}  # PDF filename -> metadata dict
-    if metadata_path:
+    if metadata_future is not None:
         try:
-            if metadata_path.lower().endswith('.csv'):
-                metadata_df = pd.read_csv(metadata_path, encoding='utf-8-sig')
-            else:
-                metadata_df = pd.read_excel(metadata_path)
+            metadata_df = metadata_future.result()
 
             # Build metadata mapping
             matching_config = matrix_config.get('metadata_matching', {})
             mapping_df = build_pdf_metadata_mapping(pdf_files, metadata_df, matching_config)
 
-            # Create lookup dict for quick access
-            for _, row in mapping_df.iterrows():
-                pdf_name = row['PDF_File']
-                metadata_dict[pdf_name] = row.to_dict()
+            # Create lookup dict for quick access (one pass, no per-row Series)
+            metadata_dict = dict(zip(mapping_df['PDF_File'], mapping_df.to_dict('records')))
 
         except Exception as e:
             logger.error(f"元数据加载失败: {e}")
@@ -728,6 +794,8 @@ def process_literature_matrix(
     # Process PDFs concurrently
     completed_count = start_index
     failed_count = 0
+    # Read once per run rather than in every worker call
+    request_delay = app_config.get('API_REQUEST_DELAY', 1)
 
     def process_pdf_wrapper(pdf_info):
         """Wrapper for processing a single PDF (for thread pool)."""
@@ -751,9 +819,8 @@ def process_literature_matrix(
         )
 
         # Add delay to avoid rate limiting
-        delay = app_config.get('API_REQUEST_DELAY', 1)
-        if delay > 0:
-            time.sleep(delay)
+        if request_delay > 0:
+            time.sleep(request_delay)
 
         return idx, result
 
@@ -869,13 +936,21 @@ def save_results(
     if file_type == 'csv':
         results_df.to_csv(output_path, index=False, encoding='utf-8-sig')
     else:
-        results_df.to_excel(output_path, index=False, engine='openpyxl')
+        write_excel_fast(results_df, output_path, index=False)
 
     # Optionally save mapping table
     if mapping_df is not None:
         mapping_path = os.path.join(output_folder, f"{folder_name}_metadata_mapping.csv")
         mapping_df.to_csv(mapping_path, index=False, encoding='utf-8-sig')
 
+        # Typed binary copy for fast reloads; the CSV stays for reading by hand
+        if PYARROW_AVAILABLE:
+            parquet_path = os.path.splitext(mapping_path)[0] + '.parquet'
+            try:
+                mapping_df.to_parquet(parquet_path, index=False, compression='zstd')
+            except Exception as e:
+                logger.warning(f"映射表 Parquet 文件保存失败: {e}")
+
     return output_path
 
 
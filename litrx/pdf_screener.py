@@ -22,16 +22,23 @@ Example usage::
 from __future__ import annotations
 
 import argparse
+import contextlib
+import csv
+import functools
+import hashlib
 import json
 import os
+import random
+import re
 import sys
+import threading
 import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
 
-import yaml
+import openai
 
-import openpyxl  # noqa: F401  # needed for pandas Excel writer
 import pandas as pd
 from tqdm import tqdm
 from pypdf import PdfReader
@@ -42,9 +49,25 @@ from .config import (
     load_env_file,
 )
 from .ai_client import AIClient
+from .cache import PdfTextCache, ResultCache
+from .constants import (
+    CHARS_PER_TOKEN_ESTIMATE,
+    DEFAULT_MAX_WORKERS,
+    EXTRACT_PREFETCH_BATCHES,
+    MAX_RETRY_ATTEMPTS,
+    RETRY_DELAY_BASE,
+    RETRY_MAX_DELAY,
+)
 from .exceptions import FileProcessingError
 from .logging_config import get_logger
-from .utils import AIResponseParser
+from .utils import (
+    AIResponseParser,
+    PYARROW_AVAILABLE,
+    list_pdf_files,
+    write_csv_fast,
+    write_excel_fast,
+    yaml_safe_load,
+)
 
 
 load_env_file()
@@ -68,20 +91,41 @@ DEFAULT_CONFIG: Dict[str, object] = {
     "METADATA_FILE_PATH": "",  # optional CSV/XLSX containing article metadata
     "METADATA_ID_COLUMNS": ["DOI", "Title"],
     "OUTPUT_FILE_SUFFIX": "_analyzed",
-    "OUTPUT_FILE_TYPE": "xlsx",  # "xlsx" or "csv"
+    "OUTPUT_FILE_TYPE": "xlsx",  # "xlsx", "csv" or "parquet" (parquet needs pyarrow)
 
     # Other configuration
     "API_REQUEST_DELAY": 1,
+    "MAX_WORKERS": DEFAULT_MAX_WORKERS,  # concurrent AI requests
+    "EXTRACT_PROCESSES": None,  # PDF parsing processes; None uses every CPU core
+    "BATCH_SIZE": 1,  # PDFs sent per AI request; >1 enumerates several documents in one prompt
+    "PROMPT_TOKEN_BUDGET": None,  # approximate tokens of PDF text sent per document; None sends it all
 }
 
 
+_PROMPTS_PATH = Path(__file__).resolve().parent.parent / "prompts_config.json"
+
+# (mtime_ns, size) of prompts_config.json -> its "pdf_screening" section
+_prompts_cache: Dict[Tuple[int, int], Dict[str, str]] = {}
+
+
 def load_prompts() -> Dict[str, str]:
-    """Load prompt templates from prompts_config.json."""
-    prompts_path = Path(__file__).resolve().parent.parent / "prompts_config.json"
+    """Load prompt templates from prompts_config.json.
+
+    The parsed section is reused until the file changes on disk, since the
+    settings window can edit prompts while the application is running.
+    """
     try:
-        with prompts_path.open("r", encoding="utf-8") as f:
+        stat = _PROMPTS_PATH.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _prompts_cache.get(signature)
+        if cached is not None:
+            return cached
+        with _PROMPTS_PATH.open("r", encoding="utf-8") as f:
             data = json.load(f)
-            return data.get("pdf_screening", {})
+        prompts = data.get("pdf_screening", {})
+        _prompts_cache.clear()
+        _prompts_cache[signature] = prompts
+        return prompts
     except Exception:
         return {}
 
@@ -94,35 +138,165 @@ def load_config(path: Optional[str] = None, questions_path: Optional[str] = None
 
     q_path = questions_path or Path(__file__).resolve().parent.parent / "configs" / "questions" / "pdf.yaml"
     with open(q_path, 'r', encoding='utf-8') as f:
-        questions = yaml.safe_load(f) or {}
+        questions = yaml_safe_load(f) or {}
 
     return config, questions
 
 
-def get_ai_response(
+def extract_pdf_text(pdf_path: str, text_cache: Optional[PdfTextCache] = None) -> str:
+    """Extract the plain text of every page in a PDF.
+
+    When ``text_cache`` is given, previously extracted text is reused and
+    newly extracted text is stored.
+    """
+
+    if text_cache is not None:
+        cached = text_cache.get(pdf_path)
+        if cached is not None:
+            return cached
+
+    reader = PdfReader(pdf_path)
+    text = "\n".join(page.extract_text() or "" for page in reader.pages)
+    if text_cache is not None:
+        text_cache.set(pdf_path, text)
+    return text
+
+
+# Headings that open the reference list / conclusion of a paper
+_REFERENCES_RE = re.compile(r"^[ \t]*(?:references|bibliography|参考文献)[ \t]*$", re.I | re.M)
+_CONCLUSION_RE = re.compile(
+    r"^[ \t]*(?:\d+\.?[ \t]*)?(?:conclusions?|concluding remarks|结论)\b", re.I | re.M
+)
+
+
+def condense_pdf_text(text: str, token_budget: Optional[int] = None) -> str:
+    """Reduce extracted PDF text to what screening needs.
+
+    The reference list is always dropped. When ``token_budget`` is set and the
+    text is still longer, the beginning (abstract, introduction, methods) is
+    kept together with the start of the conclusion section, if one is found.
+    Token counts are estimated from the character length.
+    """
+
+    half = len(text) // 2
+    references = [m for m in _REFERENCES_RE.finditer(text) if m.start() >= half]
+    if references:
+        text = text[:references[-1].start()].rstrip()
+
+    if not token_budget:
+        return text
+    max_chars = token_budget * CHARS_PER_TOKEN_ESTIMATE
+    if len(text) <= max_chars:
+        return text
+
+    conclusions = [m for m in _CONCLUSION_RE.finditer(text) if m.start() >= len(text) // 2]
+    if not conclusions:
+        return text[:max_chars]
+    tail = text[conclusions[-1].start():][:max_chars // 4]
+    return f"{text[:max_chars - len(tail)]}\n...\n{tail}"
+
+
+def load_pdf_text(
     pdf_path: str,
-    prompt: str,
-    client: AIClient,
+    text_cache: Optional[PdfTextCache] = None,
+    token_budget: Optional[int] = None,
 ) -> str:
-    """Convert a PDF to text, send with the prompt and return raw model text."""
+    """Extract (or fetch cached) PDF text and condense it for the prompt."""
 
-    reader = PdfReader(pdf_path)
-    pdf_text = "\n".join(page.extract_text() or "" for page in reader.pages)
+    return condense_pdf_text(extract_pdf_text(pdf_path, text_cache), token_budget)
 
-    messages = [
-        {
-            "role": "user",
-            "content": f"{prompt}\n\n{pdf_text}",
-        }
-    ]
 
-    response = client.request(messages)
+# Provider errors worth retrying: rate limits, timeouts, dropped connections, 5xx
+_TRANSIENT_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying ``error``, or None if it is not transient.
+
+    ``AIClient`` wraps SDK errors in ``RuntimeError``, so the original error is
+    taken from ``__cause__``. A ``Retry-After`` header is honoured; otherwise
+    the wait is drawn uniformly up to the exponential backoff ("full jitter")
+    so concurrent workers do not retry in lockstep.
+    """
+    cause = error.__cause__ or error
+    if not isinstance(cause, _TRANSIENT_ERRORS):
+        return None
+    response = getattr(cause, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_DELAY)
+        except ValueError:
+            pass
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_DELAY_BASE ** (attempt + 1)))
+
+
+def prompt_cache_options(client: AIClient, prompt: str) -> Dict[str, Any]:
+    """Request options that help the provider reuse the cached prompt prefix.
+
+    Every request of a run starts with the same instructions, which providers
+    with automatic prefix caching only need to prefill once. On the official
+    OpenAI endpoint a ``prompt_cache_key`` derived from those instructions
+    routes the requests to the same cache; other endpoints get no extra
+    fields, since OpenAI-compatible servers may reject unknown parameters.
+    """
+    base_url = str(getattr(getattr(client, "client", None), "base_url", ""))
+    if getattr(client, "service", "") != "openai" or "api.openai.com" not in base_url:
+        return {}
+    key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:32]
+    return {"extra_body": {"prompt_cache_key": f"litrx-pdf-{key}"}}
+
+
+def _request_content(
+    client: AIClient,
+    content: str,
+    request_options: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Send a single user message and return the raw model text.
+
+    Transient provider failures are retried up to ``MAX_RETRY_ATTEMPTS`` times.
+    """
+
+    messages = [{"role": "user", "content": content}]
+    for attempt in range(MAX_RETRY_ATTEMPTS):
+        try:
+            response = client.request(messages, **(request_options or {}))
+            break
+        except Exception as e:
+            delay = _retry_delay(e, attempt)
+            if delay is None or attempt == MAX_RETRY_ATTEMPTS - 1:
+                raise
+            logger.warning(f"AI请求失败，{delay:.1f}秒后重试 ({attempt + 1}/{MAX_RETRY_ATTEMPTS}): {e}")
+            time.sleep(delay)
     try:
         return response["choices"][0]["message"]["content"]
     except Exception:
         return ""
 
 
+def get_ai_response(
+    pdf_path: str,
+    prompt: str,
+    client: AIClient,
+    text_cache: Optional[PdfTextCache] = None,
+) -> str:
+    """Convert a PDF to text, send with the prompt and return raw model text."""
+
+    pdf_text = load_pdf_text(pdf_path, text_cache)
+    return _request_content(client, f"{prompt}\n\n{pdf_text}")
+
+
+def get_batch_ai_response(
+    pdf_texts: List[str],
+    prompt: str,
+    client: AIClient,
+    request_options: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Send several extracted PDF texts in one request and return raw model text."""
+
+    return _request_content(client, construct_batch_prompt(prompt, pdf_texts), request_options)
+
+
 # ---------------------------------------------------------------------------
 # Metadata matching utilities
 # ---------------------------------------------------------------------------
@@ -145,22 +319,31 @@ def build_pdf_metadata_mapping(
 ) -> pd.DataFrame:
     """Match PDFs to metadata rows via identifiers (substring match)."""
 
-    mapping_rows = []
-    lower_cols = {col: metadata[col].astype(str).str.lower() for col in id_columns if col in metadata.columns}
-
+    # Lower-case and filter each identifier column once, in pandas, leaving
+    # only (position, value) pairs for the per-PDF substring scan
+    candidates = []
+    for col in id_columns:
+        if col not in metadata.columns:
+            continue
+        lowered = metadata[col].astype("string").str.strip().str.lower()
+        valid = (lowered.notna() & (lowered != "")).to_numpy(dtype=bool)
+        candidates.append(list(zip(valid.nonzero()[0].tolist(), lowered[valid].tolist())))
+
+    matched_positions = []
     for pdf in pdf_files:
         name = pdf.lower()
-        matched_idx = None
-        for col, series in lower_cols.items():
-            hits = series[series.notna() & series.apply(lambda x: x in name)]
-            if not hits.empty:
-                matched_idx = hits.index[0]
+        matched_pos = -1
+        for column_values in candidates:
+            matched_pos = next((pos for pos, value in column_values if value in name), -1)
+            if matched_pos >= 0:
                 break
-        row = metadata.loc[matched_idx].to_dict() if matched_idx is not None else {}
-        row["PDF File"] = pdf
-        mapping_rows.append(row)
+        matched_positions.append(matched_pos)
 
-    return pd.DataFrame(mapping_rows)
+    # Gather matched rows in one take; -1 is not a label, so unmatched PDFs
+    # get an all-missing row
+    mapping = metadata.reset_index(drop=True).reindex(matched_positions).reset_index(drop=True)
+    mapping["PDF File"] = pdf_files
+    return mapping
 
 
 # ---------------------------------------------------------------------------
@@ -176,14 +359,6 @@ def construct_ai_prompt_instructions(
     """Construct the textual instructions for the model using template."""
     prompts = load_prompts()
 
-    criteria_str = ",\n".join(
-        [f'        "{c}": "请回答 \'是\', \'否\', 或 \'不确定\'"' for c in screening_criteria]
-    )
-
-    da_list = [f'        "{q["prompt_key"]}": "{q["question_text"]}"' for q in detailed_questions]
-    da_str = ",\n".join(da_list)
-    da_section = f"\n    \"detailed_analysis\": {{\n{da_str}\n    }}," if da_str else ""
-
     # Use template from prompts_config.json or fall back to default
     template = prompts.get("main_prompt", """请阅读所提供的文献并根据研究问题进行分析。请严格按照以下JSON格式以中文回答:
 {{{da_section}
@@ -193,9 +368,70 @@ def construct_ai_prompt_instructions(
 }}
 """)
 
+    return _format_prompt_instructions(
+        template,
+        tuple(screening_criteria),
+        tuple((q["prompt_key"], q["question_text"]) for q in detailed_questions),
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _format_prompt_instructions(
+    template: str,
+    screening_criteria: Tuple[str, ...],
+    detailed_questions: Tuple[Tuple[str, str], ...],
+) -> str:
+    """Fill the prompt template; memoised so repeated runs reuse the text."""
+
+    criteria_str = ",\n".join(
+        [f'        "{c}": "请回答 \'是\', \'否\', 或 \'不确定\'"' for c in screening_criteria]
+    )
+
+    da_list = [f'        "{key}": "{text}"' for key, text in detailed_questions]
+    da_str = ",\n".join(da_list)
+    da_section = f"\n    \"detailed_analysis\": {{\n{da_str}\n    }}," if da_str else ""
+
     return template.format(da_section=da_section, criteria_str=criteria_str)
 
 
+def construct_batch_prompt(prompt: str, pdf_texts: List[str]) -> str:
+    """Wrap the per-document instructions around several enumerated documents.
+
+    The model is asked to answer each document with the single-document JSON
+    structure and to collect the answers under ``results`` keyed by
+    ``pdf_index`` (1-based, matching the ``Document N`` labels).
+    """
+
+    header = (
+        f"{prompt}\n\n"
+        f"以下共有 {len(pdf_texts)} 篇文献，以 Document 1 至 Document {len(pdf_texts)} 标注。"
+        "请对每篇文献分别按上述JSON格式作答，并将全部结果汇总为一个JSON对象:\n"
+        '{"results": [{"pdf_index": 1, "detailed_analysis": {...}, "screening_results": {...}}, ...]}\n\n'
+    )
+    documents = "\n---\n".join(
+        f"Document {i}:\n{text}" for i, text in enumerate(pdf_texts, start=1)
+    )
+    return header + documents
+
+
+def _fill_parsed(
+    data: Dict[str, Any],
+    criteria_list: List[str],
+    detailed_questions: List[Dict[str, str]],
+    missing: str = "缺失",
+) -> Dict[str, Dict[str, str]]:
+    """Project parsed JSON onto the expected keys, filling gaps with ``missing``."""
+
+    analysis = data.get("detailed_analysis") or {}
+    screening = data.get("screening_results") or {}
+    return {
+        "detailed_analysis": {
+            q["prompt_key"]: analysis.get(q["prompt_key"], missing) for q in detailed_questions
+        },
+        "screening_results": {c: screening.get(c, missing) for c in criteria_list},
+    }
+
+
 def parse_ai_response_json(
     ai_json_string: str,
     criteria_list: List[str],
@@ -203,42 +439,112 @@ def parse_ai_response_json(
 ) -> Dict[str, Dict[str, str]]:
     """Parse the JSON response with fallback, ensuring all keys exist."""
 
-    final: Dict[str, Dict[str, str]] = {"detailed_analysis": {}, "screening_results": {}}
     try:
         # Use unified parser with markdown cleaning and regex fallback
         data = AIResponseParser.parse_json_with_fallback(ai_json_string)
     except (json.JSONDecodeError, ValueError) as e:
         logger.error(f"JSON解析失败: {e}")
-        for q in detailed_questions:
-            final["detailed_analysis"][q["prompt_key"]] = "解析失败"
-        for c in criteria_list:
-            final["screening_results"][c] = "解析失败"
-        return final
+        return _fill_parsed({}, criteria_list, detailed_questions, "解析失败")
+
+    return _fill_parsed(data, criteria_list, detailed_questions)
+
+
+def parse_batch_ai_response_json(
+    ai_json_string: str,
+    count: int,
+    criteria_list: List[str],
+    detailed_questions: List[Dict[str, str]],
+) -> List[Dict[str, Dict[str, str]]]:
+    """Parse a batched ``{"results": [...]}`` response into ``count`` results.
+
+    Entries are placed by their ``pdf_index`` when present and valid, otherwise
+    by position. Documents without an answer are filled with ``"缺失"``.
+    """
+
+    try:
+        data = AIResponseParser.parse_json_with_fallback(ai_json_string)
+    except (json.JSONDecodeError, ValueError) as e:
+        logger.error(f"JSON解析失败: {e}")
+        failed = _fill_parsed({}, criteria_list, detailed_questions, "解析失败")
+        return [failed] * count
 
-    for q in detailed_questions:
-        final["detailed_analysis"][q["prompt_key"]] = data.get("detailed_analysis", {}).get(q["prompt_key"], "缺失")
-    for c in criteria_list:
-        final["screening_results"][c] = data.get("screening_results", {}).get(c, "缺失")
-    return final
+    entries = data.get("results") if isinstance(data, dict) else None
+    slots: List[Dict[str, Any]] = [{} for _ in range(count)]
+    for position, entry in enumerate(entries if isinstance(entries, list) else []):
+        if not isinstance(entry, dict):
+            continue
+        index = entry.get("pdf_index")
+        slot = index - 1 if isinstance(index, int) and 1 <= index <= count else position
+        if slot < count:
+            slots[slot] = entry
+    return [_fill_parsed(entry, criteria_list, detailed_questions) for entry in slots]
 
 
 # ---------------------------------------------------------------------------
-# Main program
+# Incremental result staging
 # ---------------------------------------------------------------------------
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="AI-assisted PDF screening")
-    parser.add_argument("--config", help="Path to JSON or YAML config file", default=None)
-    parser.add_argument("--pdf-folder", help="Folder containing PDFs", default=None)
-    parser.add_argument("--metadata-file", help="Optional metadata CSV/XLSX", default=None)
-    args = parser.parse_args()
+def load_staged_results(path: str, fieldnames: List[str]) -> Dict[str, Dict[str, object]]:
+    """Read rows staged by an interrupted run, keyed by PDF file name.
 
-    config, questions = load_config(args.config)
-    if args.pdf_folder:
-        config["INPUT_PDF_FOLDER_PATH"] = args.pdf_folder
-    if args.metadata_file:
-        config["METADATA_FILE_PATH"] = args.metadata_file
+    A staging file written for different questions (other header) is ignored
+    and will be overwritten.
+    """
+
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.DictReader(f)
+            if reader.fieldnames != fieldnames:
+                logger.info(f"中间结果与当前问题不一致，将重新筛选: {path}")
+                return {}
+            return {row["PDF文件名"]: row for row in reader}
+    except (OSError, csv.Error, UnicodeDecodeError) as e:
+        logger.warning(f"读取中间结果失败，将重新筛选: {e}")
+        return {}
+
+
+def _open_staging(path: str, fieldnames: List[str], resume: bool) -> IO[str]:
+    """Open the staging CSV, appending when resuming or starting a new file with a header."""
+
+    if resume:
+        # The BOM was written with the header; appended rows are plain UTF-8
+        return open(path, "a", encoding="utf-8", newline="")
+    f = open(path, "w", encoding="utf-8-sig", newline="")
+    csv.DictWriter(f, fieldnames=fieldnames).writeheader()
+    f.flush()
+    return f
+
+
+# ---------------------------------------------------------------------------
+# Main program
+# ---------------------------------------------------------------------------
+
+
+def screen_pdfs(
+    config: Dict[str, Any],
+    questions: Dict[str, Any],
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    status_callback: Optional[Callable[[str, str], None]] = None,
+) -> str:
+    """Screen every PDF in ``config['INPUT_PDF_FOLDER_PATH']`` and save the results.
+
+    This is the programmatic entry point; ``main`` only parses command line
+    arguments into ``config`` before calling it.
+
+    Args:
+        config: Module configuration (see ``DEFAULT_CONFIG``)
+        questions: Question templates with ``yes_no_questions``/``open_questions``
+        progress_callback: Optional callback(current, total) after each batch
+        status_callback: Optional callback(pdf_name, status) with per-PDF
+            status text; when either callback is given the console progress
+            bar is turned off
+
+    Returns:
+        Path to the saved results file
+    """
     client = AIClient(config)
 
     research_question = config.get("RESEARCH_QUESTION", "")
@@ -257,7 +563,7 @@ def main() -> None:
             help_text="请使用 --pdf-folder 参数指定有效的PDF文件夹路径。"
         )
 
-    pdf_files = [f for f in os.listdir(pdf_folder) if f.lower().endswith(".pdf")]
+    pdf_files = sorted(list_pdf_files(pdf_folder))
     if not pdf_files:
         raise FileProcessingError(
             f"在指定文件夹中未找到PDF文件: {pdf_folder}",
@@ -272,7 +578,7 @@ def main() -> None:
                 pdf_files, metadata_df, config.get("METADATA_ID_COLUMNS", [])
             )
             map_path = os.path.join(pdf_folder, "pdf_metadata_mapping.csv")
-            mapping_df.to_csv(map_path, index=False, encoding="utf-8-sig")
+            write_csv_fast(mapping_df, map_path)
             logger.info(f"已生成PDF与元数据映射表: {map_path}")
         except Exception as e:
             logger.error(f"元数据匹配失败: {e}")
@@ -281,28 +587,214 @@ def main() -> None:
         research_question, criteria_list, detailed_questions
     )
 
-    results = []
-    for pdf in tqdm(pdf_files, desc="Processing PDFs"):
-        full_path = os.path.join(pdf_folder, pdf)
-        raw_text = get_ai_response(full_path, base_prompt, client)
-        parsed = parse_ai_response_json(raw_text, criteria_list, detailed_questions)
-
-        row: Dict[str, object] = {"PDF文件名": pdf}
-        for q in detailed_questions:
-            row[q["df_column_name"]] = parsed["detailed_analysis"][q["prompt_key"]]
-        for c in criteria_list:
-            row[f"筛选_{c}"] = parsed["screening_results"][c]
-        results.append(row)
-        time.sleep(config.get("API_REQUEST_DELAY", 1))
-
-    df = pd.DataFrame(results)
     folder_name = os.path.basename(os.path.normpath(pdf_folder))
     output_base = f"{folder_name}{config['OUTPUT_FILE_SUFFIX']}"
-    output_ext = f".{config.get('OUTPUT_FILE_TYPE', 'xlsx')}"
-    output_path = os.path.join(pdf_folder, f"{output_base}{output_ext}")
+    output_type = config.get("OUTPUT_FILE_TYPE", "xlsx")
+    if output_type == "parquet" and not PYARROW_AVAILABLE:
+        logger.warning("未安装 pyarrow，无法输出 Parquet，改为保存 xlsx")
+        output_type = "xlsx"
+    output_path = os.path.join(pdf_folder, f"{output_base}.{output_type}")
+
+    fieldnames = ["PDF文件名"]
+    fieldnames += [q["df_column_name"] for q in detailed_questions]
+    fieldnames += [f"筛选_{c}" for c in criteria_list]
+
+    # Rows are appended to a staging CSV as batches finish, so an interrupted
+    # run keeps its completed PDFs and the next run only screens the rest
+    staging_path = None
+    staged_rows: Dict[str, Dict[str, object]] = {}
+    if config.get("ENABLE_PROGRESS_CHECKPOINTS", True):
+        staging_path = os.path.join(pdf_folder, f"{output_base}_partial.csv")
+        staged_rows = load_staged_results(staging_path, fieldnames)
+        if staged_rows:
+            logger.info(f"从中间结果恢复，已完成 {len(staged_rows)} 个PDF")
+    # Also collects result cache hits below, so it cannot tell whether the
+    # staging file holds a valid header; ``staged_rows`` decides that
+    results_by_pdf: Dict[str, Dict[str, object]] = dict(staged_rows)
+
+    total = len(pdf_files)
+    batch_size = max(1, int(config.get("BATCH_SIZE", 1)))
+    max_workers = max(1, int(config.get("MAX_WORKERS", DEFAULT_MAX_WORKERS)))
+    # Read once per run rather than in every worker call
+    request_delay = config.get("API_REQUEST_DELAY", 1)
+    text_cache = PdfTextCache() if config.get("ENABLE_CACHE", True) else None
+    token_budget = config.get("PROMPT_TOKEN_BUDGET")
+    # The instructions lead every request, so they form a shared cacheable prefix
+    request_options = prompt_cache_options(client, base_prompt)
+    show_bar = progress_callback is None and status_callback is None
+
+    # Extraction runs only a few batches ahead of screening and each text is
+    # dropped once its batch takes it, so memory does not grow with the folder
+    text_futures: Dict[str, Future] = {}
+    futures: Dict[Future, int] = {}
+    extract_lock = threading.Lock()
+    next_extract = 0
+
+    def prefetch_text(last_batch: int) -> None:
+        """Submit text extraction for every batch up to ``last_batch`` not yet queued."""
+        nonlocal next_extract
+        with extract_lock:
+            while next_extract <= min(last_batch, len(batches) - 1):
+                for pdf in batches[next_extract]:
+                    text_futures[pdf] = extract_pool.submit(
+                        load_pdf_text, os.path.join(pdf_folder, pdf), text_cache, token_budget
+                    )
+                next_extract += 1
+
+    def cancel_pending() -> None:
+        """Cancel queued screening batches and stop queuing PDF text extraction."""
+        nonlocal next_extract
+        with extract_lock:
+            next_extract = len(batches)
+            queued = list(text_futures.values())
+        for queued_future in (*futures, *queued):
+            queued_future.cancel()
+
+    def screen_batch(i: int) -> List[Dict[str, object]]:
+        """Screen batch ``i`` of PDFs and return its result rows (thread pool task)."""
+        batch = batches[i]
+        if status_callback:
+            for pdf in batch:
+                status_callback(pdf, "处理中")
+        prefetch_text(i + EXTRACT_PREFETCH_BATCHES)
+        texts = [text_futures.pop(pdf).result() for pdf in batch]
+        if len(batch) == 1:
+            raw_text = _request_content(client, f"{base_prompt}\n\n{texts[0]}", request_options)
+            parsed_batch = [parse_ai_response_json(raw_text, criteria_list, detailed_questions)]
+        else:
+            raw_text = get_batch_ai_response(texts, base_prompt, client, request_options)
+            parsed_batch = parse_batch_ai_response_json(
+                raw_text, len(batch), criteria_list, detailed_questions
+            )
 
-    if output_ext == ".csv":
-        df.to_csv(output_path, index=False, encoding="utf-8-sig")
+        rows = []
+        for pdf, parsed in zip(batch, parsed_batch):
+            row: Dict[str, object] = {"PDF文件名": pdf}
+            for q in detailed_questions:
+                row[q["df_column_name"]] = parsed["detailed_analysis"][q["prompt_key"]]
+            for c in criteria_list:
+                row[f"筛选_{c}"] = parsed["screening_results"][c]
+            rows.append(row)
+
+        # Add delay to avoid rate limiting
+        if request_delay > 0:
+            time.sleep(request_delay)
+        return rows
+
+    pending = [pdf for pdf in pdf_files if pdf not in results_by_pdf]
+
+    # PDFs screened before with the same model, text budget and instructions
+    # are answered from the result cache without an API call
+    result_cache = None
+    cache_questions = f"{getattr(client, 'model', '')}|{token_budget}|{base_prompt}"
+    fingerprints: Dict[str, str] = {}
+    if config.get("ENABLE_CACHE", True) and pending:
+        result_cache = ResultCache(ttl_days=config.get("CACHE_TTL_DAYS", 30))
+        cache_hits = []
+        for pdf in pending:
+            try:
+                fingerprints[pdf] = PdfTextCache.fingerprint(os.path.join(pdf_folder, pdf))
+            except OSError:
+                continue
+            cached = result_cache.get(fingerprints[pdf], "", cache_questions)
+            if cached and all(name in cached for name in fieldnames[1:]):
+                results_by_pdf[pdf] = {"PDF文件名": pdf, **{name: cached[name] for name in fieldnames[1:]}}
+                cache_hits.append(pdf)
+        if cache_hits:
+            logger.info(f"缓存命中 {len(cache_hits)} 个PDF，跳过AI请求")
+            if status_callback:
+                for pdf in cache_hits:
+                    status_callback(pdf, "缓存命中")
+            pending = [pdf for pdf in pending if pdf not in results_by_pdf]
+
+    batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    current = total - len(pending)
+    if progress_callback and current:
+        progress_callback(current, total)
+    # PDF parsing is CPU-bound and holds the GIL, so it runs in separate
+    # processes; AI requests wait on the parsed text from the thread pool
+    extract_processes = min(config.get("EXTRACT_PROCESSES") or os.cpu_count() or 1, max(len(pending), 1))
+    staging_cm = (
+        _open_staging(staging_path, fieldnames, resume=bool(staged_rows))
+        if staging_path else contextlib.nullcontext()
+    )
+    with staging_cm as staging_file, \
+            ProcessPoolExecutor(max_workers=extract_processes) as extract_pool, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor, \
+            tqdm(total=total, initial=current, desc="Processing PDFs", disable=not show_bar) as bar:
+        staging_writer = csv.DictWriter(staging_file, fieldnames=fieldnames) if staging_file else None
+        prefetch_text(EXTRACT_PREFETCH_BATCHES - 1)
+        futures.update({executor.submit(screen_batch, i): i for i in range(len(batches))})
+        try:
+            for future in as_completed(futures):
+                i = futures[future]
+                batch = batches[i]
+                try:
+                    rows = future.result()
+                    status = "完成"
+                    for row in rows:
+                        pdf = row["PDF文件名"]
+                        results_by_pdf[pdf] = row
+                        # Unparseable answers are not cached so a later run retries them
+                        if result_cache is not None and pdf in fingerprints and "解析失败" not in row.values():
+                            result_cache.set(
+                                fingerprints[pdf], "",
+                                {k: v for k, v in row.items() if k != "PDF文件名"},
+                                cache_questions,
+                            )
+                    if staging_writer is not None:
+                        staging_writer.writerows(rows)
+                        staging_file.flush()
+                except Exception as e:
+                    logger.error(f"处理PDF {', '.join(batch)} 时发生错误: {e}", exc_info=True)
+                    status = f"错误: {e}"
+                current += len(batch)
+                if status_callback:
+                    for pdf in batch:
+                        status_callback(pdf, status)
+                if progress_callback:
+                    progress_callback(current, total)
+                bar.update(len(batch))
+        except BaseException:
+            # Interrupted (Ctrl+C or a failing callback): drop the batches and
+            # extractions that have not started, so no more API calls are paid
+            # for results that would never be staged
+            cancel_pending()
+            raise
+
+    # Keep folder order in the output regardless of completion order
+    results = [results_by_pdf[pdf] for pdf in pdf_files if pdf in results_by_pdf]
+
+    df = pd.DataFrame(results, columns=fieldnames)
+    # Screening answers repeat a handful of labels ("是"/"否"/"不确定"), so
+    # categorical codes are smaller in memory and quicker to serialise
+    for col in df.columns:
+        if col.startswith("筛选_"):
+            df[col] = df[col].astype("category")
+    if output_type == "csv":
+        write_csv_fast(df, output_path)
+    elif output_type == "parquet":
+        df.to_parquet(output_path, index=False, compression="zstd")
     else:
-        df.to_excel(output_path, index=False, engine="openpyxl")
+        write_excel_fast(df, output_path, index=False)
+    # Keep the staging file while any PDF failed so a re-run retries only those
+    if staging_path and len(results) == total and os.path.exists(staging_path):
+        os.remove(staging_path)
     logger.info(f"处理完成，结果已保存到 {output_path}")
+    return output_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="AI-assisted PDF screening")
+    parser.add_argument("--config", help="Path to JSON or YAML config file", default=None)
+    parser.add_argument("--pdf-folder", help="Folder containing PDFs", default=None)
+    parser.add_argument("--metadata-file", help="Optional metadata CSV/XLSX", default=None)
+    args = parser.parse_args()
+
+    config, questions = load_config(args.config)
+    if args.pdf_folder:
+        config["INPUT_PDF_FOLDER_PATH"] = args.pdf_folder
+    if args.metadata_file:
+        config["METADATA_FILE_PATH"] = args.metadata_file
+
+    screen_pdfs(config, questions)
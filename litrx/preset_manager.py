@@ -9,6 +9,7 @@
 
 from __future__ import annotations
 
+import json
 import re
 import shutil
 from datetime import datetime
@@ -19,6 +20,7 @@ import yaml
 
 from .logging_config import get_logger
 from .resources import resource_path
+from .utils import yaml_safe_dump, yaml_safe_load
 
 logger = get_logger(__name__)
 
@@ -86,19 +88,64 @@ class MatrixPresetManager:
         if not preset_path.exists():
             raise FileNotFoundError(f"方案不存在: {preset_key}")
 
+        cached = self._read_parsed_cache(preset_path)
+        if cached is not None:
+            logger.info(f"Loaded preset: {preset_key} (cached)")
+            return cached
+
         try:
             with open(preset_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml_safe_load(f)
 
             if not isinstance(config, dict):
                 raise ValueError(f"方案格式错误: 应为字典类型")
 
+            self._write_parsed_cache(preset_path, config)
             logger.info(f"Loaded preset: {preset_key}")
             return config
 
         except yaml.YAMLError as e:
             raise ValueError(f"方案文件格式错误: {e}")
 
+    def _parsed_cache_path(self, preset_path: Path) -> Path:
+        """解析结果缓存文件路径（.cache/<方案名>.json）"""
+        return self.presets_dir / ".cache" / f"{preset_path.stem}.json"
+
+    @staticmethod
+    def _source_signature(preset_path: Path) -> List[int]:
+        """YAML文件的修改时间和大小，用于判断缓存是否过期"""
+        stat = preset_path.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _read_parsed_cache(self, preset_path: Path) -> Optional[Dict]:
+        """读取与YAML文件一致的JSON解析缓存，缺失或过期时返回None"""
+        cache_path = self._parsed_cache_path(preset_path)
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get("source") != self._source_signature(preset_path):
+                return None
+            config = cached.get("config")
+            return config if isinstance(config, dict) else None
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _write_parsed_cache(self, preset_path: Path, config: Dict) -> None:
+        """保存JSON解析缓存；写入失败（如只读目录）时忽略"""
+        cache_path = self._parsed_cache_path(preset_path)
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            payload = {"source": self._source_signature(preset_path), "config": config}
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+        except (OSError, TypeError, ValueError) as e:
+            # YAML中的日期等类型无法写入JSON：不留半写的缓存，下次直接解析YAML
+            try:
+                cache_path.unlink()
+            except OSError:
+                pass
+            logger.debug(f"Preset cache not written for {preset_path.name}: {e}")
+
     def save_preset(self, preset_key: str, config: Dict, display_name: Optional[str] = None) -> None:
         """保存方案
 
@@ -129,7 +176,7 @@ class MatrixPresetManager:
             # 写入元数据注释
             f.write(metadata_lines)
             # 写入YAML内容
-            yaml.safe_dump(config, f, allow_unicode=True, sort_keys=False, default_flow_style=False)
+            yaml_safe_dump(config, f, allow_unicode=True, sort_keys=False, default_flow_style=False)
 
         logger.info(f"Saved preset: {preset_key}")
 
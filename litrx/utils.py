@@ -2,15 +2,319 @@
 Utility functions and classes for the LitRx Toolkit.
 Provides shared functionality to reduce code duplication.
 """
+import importlib.util
 import json
+import os
 import re
 import threading
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+from .constants import CSV_WRITE_CHUNK_ROWS
 from .logging_config import get_logger
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Optional speedups are only probed here; each one is imported where it is
+# used so importing this module (and every GUI tab) stays cheap
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+CALAMINE_AVAILABLE = importlib.util.find_spec('python_calamine') is not None
+XLSXWRITER_AVAILABLE = importlib.util.find_spec('xlsxwriter') is not None
+
 logger = get_logger(__name__)
 
+# Write buffer for CSV output; large enough that big exports reach the
+# file system in a few large writes instead of one small write per row
+_CSV_WRITE_BUFFER_BYTES = 4 * 1024 * 1024
+
+
+def json_loads(text: str) -> Any:
+    """Decode JSON using orjson when it is installed, else the json module.
+
+    Input that orjson rejects but the standard library accepts (such as
+    ``NaN`` literals) is retried with ``json.loads``, so results do not
+    depend on whether orjson is available.
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def json_dump_file(obj: Any, file_path: str) -> None:
+    """Write ``obj`` as indented UTF-8 JSON, replacing ``file_path`` atomically.
+
+    The document is serialized in one call (orjson when installed, producing
+    the same layout as ``json.dump(..., ensure_ascii=False, indent=2)``),
+    written to a temporary file next to the target and moved into place with
+    ``os.replace``, so a crash never leaves a half-written file behind.
+    """
+    payload = None
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # Types orjson refuses (e.g. non-string keys) go through json
+            pass
+    if payload is None:
+        payload = json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+    tmp_path = f"{file_path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def list_pdf_files(folder: str) -> List[str]:
+    """Return the names of PDF files directly inside ``folder``.
+
+    Uses ``os.scandir`` so the file-type check comes from the cached
+    directory entry; subdirectories are skipped. Order is the directory's
+    listing order, as with ``os.listdir``.
+    """
+    with os.scandir(folder) as entries:
+        return [e.name for e in entries if e.name[-4:].lower() == '.pdf' and e.is_file()]
+
+
+def yaml_safe_load(stream: Any) -> Any:
+    """Parse YAML like ``yaml.safe_load``, using libyaml's C parser when available."""
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def yaml_safe_dump(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    """Serialize YAML like ``yaml.safe_dump``, using libyaml's C emitter when available."""
+    import yaml
+
+    return yaml.dump(data, stream, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper), **kwargs)
+
+
+def read_csv_fast(file_path: str, **kwargs: Any):
+    """Read a whole CSV file into a DataFrame, preferring the pyarrow parser.
+
+    The multithreaded pyarrow engine is used when pyarrow is installed. If it
+    rejects the file (it is stricter about malformed rows) or an option it
+    does not support, the file is re-read with pandas' default engine, which
+    memory-maps the file unless ``memory_map`` is given explicitly.
+
+    Args:
+        file_path: Path to the CSV file
+        **kwargs: Extra arguments for ``pandas.read_csv``
+
+    Returns:
+        pandas DataFrame
+    """
+    import pandas as pd
+
+    if PYARROW_AVAILABLE:
+        try:
+            return pd.read_csv(file_path, engine='pyarrow', **kwargs)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            logger.debug(f"pyarrow CSV engine failed for {file_path}, using default engine: {e}")
+    # Parse straight from the mapped file instead of copying through Python IO buffers
+    kwargs.setdefault('memory_map', True)
+    return pd.read_csv(file_path, **kwargs)
+
+
+def read_excel_fast(file_path: str, **kwargs: Any):
+    """Read an Excel sheet into a DataFrame, preferring the calamine engine.
+
+    The Rust-based calamine reader is used when python-calamine is installed
+    (pandas >= 2.2); otherwise, or if it fails, pandas' default openpyxl
+    reader is used.
+
+    Args:
+        file_path: Path to the Excel file
+        **kwargs: Extra arguments for ``pandas.read_excel``
+
+    Returns:
+        pandas DataFrame
+    """
+    import pandas as pd
+
+    if CALAMINE_AVAILABLE:
+        try:
+            return pd.read_excel(file_path, engine='calamine', **kwargs)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            logger.debug(f"calamine Excel engine failed for {file_path}, using default engine: {e}")
+    return pd.read_excel(file_path, **kwargs)
+
+
+def write_xlsx_streaming(df: Any, file_path: str, sheet_name: str = 'Sheet1') -> None:
+    """Write a DataFrame to an .xlsx file one row at a time.
+
+    Rows are streamed to the sheet in order instead of building the styled
+    cell grid that ``DataFrame.to_excel`` creates, so memory stays flat and
+    large frames are written much faster. xlsxwriter's ``constant_memory``
+    mode is used when installed, otherwise openpyxl's write-only mode. The
+    index is not written and the header row is plain text.
+
+    Args:
+        df: DataFrame to write
+        file_path: Destination path
+        sheet_name: Name of the worksheet
+    """
+    import pandas as pd
+
+    header = [str(c) for c in df.columns]
+    # Missing values become empty cells rather than "nan"
+    rows = df.astype(object).where(pd.notna(df), None).itertuples(index=False, name=None)
+
+    if XLSXWRITER_AVAILABLE:
+        import xlsxwriter  # type: ignore
+
+        wb = xlsxwriter.Workbook(file_path, {'constant_memory': True})
+        ws = wb.add_worksheet(sheet_name)
+        ws.write_row(0, 0, header)
+        for r, row in enumerate(rows, start=1):
+            ws.write_row(r, 0, row)
+        wb.close()
+        return
+
+    import openpyxl
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    ws.append(header)
+    for row in rows:
+        ws.append(row)
+    wb.save(file_path)
+
+
+def write_excel_fast(df: Any, file_path: str, **kwargs: Any) -> None:
+    """Write a DataFrame to an .xlsx file with the fastest available writer.
+
+    Index-free writes are streamed row by row by :func:`write_xlsx_streaming`
+    (xlsxwriter in ``constant_memory`` mode when installed). Anything else
+    goes through ``DataFrame.to_excel`` with xlsxwriter, or openpyxl when
+    xlsxwriter is missing; ``constant_memory`` cannot be used there because
+    pandas writes cells column by column.
+
+    Args:
+        df: DataFrame to write
+        file_path: Destination path
+        **kwargs: Extra arguments for ``DataFrame.to_excel``
+    """
+    if kwargs.get('index', True) is False and set(kwargs) <= {'index', 'sheet_name'}:
+        write_xlsx_streaming(df, file_path, sheet_name=kwargs.get('sheet_name', 'Sheet1'))
+    elif XLSXWRITER_AVAILABLE:
+        df.to_excel(file_path, engine='xlsxwriter', **kwargs)
+    else:
+        df.to_excel(file_path, engine='openpyxl', **kwargs)
+
+
+def _arrow_csv_matches_pandas(arrow_type: Any) -> bool:
+    """Whether pyarrow's CSV writer renders ``arrow_type`` the way ``to_csv`` does."""
+    import pyarrow as pa
+
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    return (
+        pa.types.is_string(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_integer(arrow_type)
+        or pa.types.is_null(arrow_type)
+    )
+
+
+def write_csv_fast(
+    df: Any,
+    file_path: str,
+    encoding: str = 'utf-8-sig',
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> None:
+    """Write a DataFrame to CSV without its index, preferring pyarrow's writer.
+
+    pyarrow's C++ CSV writer is used when installed and the encoding is UTF-8
+    (the BOM for ``utf-8-sig`` is written first so Excel still detects it).
+    The header line comes from pandas, and booleans, floats and datetimes are
+    formatted by pandas before they reach pyarrow, so values read back the same
+    as ``DataFrame.to_csv`` output (``True``, ``2.0``, ``2020-01-01``). The one
+    visible difference is that pyarrow quotes every text value. Frames pyarrow
+    cannot convert, such as mixed-type object columns, are written by pandas
+    instead. Either way the file is written through a large buffer,
+    ``CSV_WRITE_CHUNK_ROWS`` rows at a time, so only one chunk is converted to
+    text at once.
+
+    Args:
+        df: DataFrame to write
+        file_path: Destination path
+        encoding: Output encoding (default: UTF-8 with BOM)
+        progress_callback: Optional callable receiving (rows_written, total_rows)
+            after each chunk; the count only increases, even when the pandas
+            fallback rewrites chunks pyarrow had already reported
+    """
+    total = len(df)
+    # At least one step so an empty frame still gets its header line
+    starts = range(0, max(total, 1), CSV_WRITE_CHUNK_ROWS)
+
+    reported = -1
+
+    def report(start: int) -> None:
+        # A pandas rewrite after a pyarrow failure starts again from row 0;
+        # rows already reported are not reported again, so progress never goes back
+        nonlocal reported
+        done = min(start + CSV_WRITE_CHUNK_ROWS, total)
+        if progress_callback is not None and done > reported:
+            reported = done
+            progress_callback(done, total)
+
+    if PYARROW_AVAILABLE and encoding.lower() in ('utf-8', 'utf-8-sig'):
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        try:
+            # Types come from the whole frame so every chunk shares one schema
+            schema = pa.Schema.from_pandas(df, preserve_index=False).remove_metadata()
+            text_cols = [field.name for field in schema if not _arrow_csv_matches_pandas(field.type)]
+            schema = pa.schema(
+                [pa.field(field.name, pa.string()) if field.name in text_cols else field for field in schema]
+            )
+            with open(file_path, 'wb', buffering=_CSV_WRITE_BUFFER_BYTES) as f:
+                if encoding.lower() == 'utf-8-sig':
+                    f.write(b'\xef\xbb\xbf')
+                f.write(df.iloc[:0].to_csv(index=False).encode('utf-8'))
+                writer = pa_csv.CSVWriter(
+                    f, schema,
+                    write_options=pa_csv.WriteOptions(include_header=False, quoting_style='needed'),
+                )
+                for start in starts:
+                    chunk = df.iloc[start:start + CSV_WRITE_CHUNK_ROWS]
+                    if text_cols:
+                        chunk = chunk.copy()
+                        for col in text_cols:
+                            chunk[col] = chunk[col].astype(str).where(chunk[col].notna(), None)
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                    report(start)
+                writer.close()
+            return
+        except pa.ArrowException as e:
+            # Anything already written is replaced by the pandas writer below
+            logger.debug(f"pyarrow cannot convert frame for {file_path}, using pandas writer: {e}")
+    with open(file_path, 'w', encoding=encoding, newline='', buffering=_CSV_WRITE_BUFFER_BYTES) as f:
+        for start in starts:
+            df.iloc[start:start + CSV_WRITE_CHUNK_ROWS].to_csv(f, index=False, header=start == 0)
+            report(start)
+
 
 class AsyncTaskRunner:
     """Unified async task execution for GUI operations.
@@ -117,7 +421,7 @@ class AIResponseParser:
         # Try standard JSON parsing first
         try:
             cleaned = AIResponseParser.clean_json_response(text)
-            return json.loads(cleaned)
+            return json_loads(cleaned)
         except json.JSONDecodeError:
             logger.warning("JSON parsing failed, attempting regex fallback")
             return AIResponseParser._regex_fallback(text)
@@ -84,3 +84,20 @@ def test_verification_error_sets_failure_message():
 
     assert df.at[0, "open1_col_verified"] == "验证失败"
     assert df.at[0, "crit1_col_verified"] == "验证失败"
+
+
+def test_compute_screening_statistics_counts_answers():
+    from litrx.abstract_screener import compute_screening_statistics
+
+    df = pd.DataFrame({
+        "crit1_col": ["是", "否", "是", None],
+        "crit1_col_verified": ["是", "否", "", ""],
+        "open1_col": ["总结", "", "信息缺失", None],
+    })
+    stats = compute_screening_statistics(df, OPEN_QUESTIONS, YES_NO_QUESTIONS)
+    assert stats["total_articles"] == 4
+    assert stats["yes_no_results"]["是否相关?"] == {
+        "是": 2, "否": 1, "不确定": 0, "其他": 1,
+        "verification": {"已验证": 1, "未验证": 1, "不确定": 0},
+    }
+    assert stats["open_question_stats"]["请总结"] == {"answered": 1, "missing": 3}
@@ -0,0 +1,78 @@
+"""Unit tests for the caches in litrx/cache.py."""
+
+from litrx.cache import PdfTextCache, ResultCache, normalize_cache_text
+
+
+class TestNormalizeCacheText:
+    """Test cache key normalization."""
+
+    def test_collapses_whitespace_and_case(self):
+        """Formatting-only differences normalize to the same text."""
+        a = normalize_cache_text("Deep  Learning\nfor\tNLP ")
+        b = normalize_cache_text("deep learning for nlp")
+        assert a == b
+
+    def test_non_string_input(self):
+        """Missing values (e.g. NaN floats) are converted instead of failing."""
+        assert normalize_cache_text(float("nan")) == "nan"
+
+
+class TestResultCache:
+    """Test ResultCache storage and lookup."""
+
+    def test_set_then_get(self, tmp_path):
+        cache = ResultCache(cache_dir=tmp_path)
+        cache.set("Title", "Abstract", {"relevance_score": 80}, "topic")
+        assert cache.get("Title", "Abstract", "topic") == {"relevance_score": 80}
+        assert cache.get("Title", "Abstract", "other topic") is None
+
+    def test_disk_entries_survive_new_instance(self, tmp_path):
+        ResultCache(cache_dir=tmp_path).set("T", "A", {"analysis": "x"})
+        assert ResultCache(cache_dir=tmp_path).get("T", "A") == {"analysis": "x"}
+
+    def test_memory_layer_cleared_with_disk(self, tmp_path):
+        cache = ResultCache(cache_dir=tmp_path)
+        cache.set("T", "A", {"analysis": "x"})
+        assert cache.clear_all() == 1
+        assert cache.get("T", "A") is None
+
+    def test_memory_layer_is_bounded(self, tmp_path):
+        cache = ResultCache(cache_dir=tmp_path, max_memory_entries=2)
+        cache.set("T1", "A", {"analysis": "1"})
+        cache.set("T2", "A", {"analysis": "2"})
+        cache.get("T1", "A")
+        cache.set("T3", "A", {"analysis": "3"})
+        assert len(cache._memory) == 2
+        # Evicted entries are still served from disk
+        assert cache.get("T2", "A") == {"analysis": "2"}
+
+    def test_concurrent_use_at_capacity(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = ResultCache(cache_dir=tmp_path, max_memory_entries=4)
+
+        def work(n):
+            cache.set(f"T{n}", "A", {"analysis": str(n)})
+            return cache.get(f"T{n}", "A")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(work, range(200)))
+        assert results == [{"analysis": str(n)} for n in range(200)]
+        assert len(cache._memory) == 4
+
+
+class TestPdfTextCache:
+    """Test the fingerprint-keyed PDF text cache."""
+
+    def test_copied_file_hits_edited_file_misses(self, tmp_path):
+        cache = PdfTextCache(cache_dir=tmp_path / "cache")
+        original = tmp_path / "a.pdf"
+        original.write_bytes(b"%PDF-1.4 body" * 100)
+        cache.set(str(original), "extracted text")
+
+        copy = tmp_path / "renamed.pdf"
+        copy.write_bytes(original.read_bytes())
+        assert cache.get(str(copy)) == "extracted text"
+
+        original.write_bytes(b"%PDF-1.4 edited" * 100)
+        assert cache.get(str(original)) is None
@@ -0,0 +1,91 @@
+"""Tests for LiteratureAnalyzer CSV reading helpers (litrx/csv_analyzer.py)."""
+
+import pandas as pd
+import pytest
+
+import litrx.csv_analyzer as csv_mod
+from litrx.exceptions import FileProcessingError
+
+
+class DummyAIClient:
+    """Stand-in for AIClient; the reading helpers never call the API."""
+
+    def __init__(self, config):
+        self.config = config
+
+
+@pytest.fixture
+def analyzer(monkeypatch, mock_config):
+    monkeypatch.setattr(csv_mod, "AIClient", DummyAIClient)
+    return csv_mod.LiteratureAnalyzer({**mock_config, "ENABLE_CACHE": False}, "topic")
+
+
+@pytest.fixture
+def scopus_csv(tmp_path):
+    path = tmp_path / "scopus.csv"
+    path.write_text(
+        'Article Title,Abstract,Year\n'
+        'Paper A,"first line\nsecond line",2020\n'
+        'Paper B,Abstract B,2021\n'
+        'Paper C,Abstract C,2022\n',
+        encoding="utf-8-sig",
+    )
+    return str(path)
+
+
+def test_count_csv_rows_handles_multiline_fields(scopus_csv):
+    assert csv_mod.LiteratureAnalyzer.count_csv_rows(scopus_csv) == 3
+
+
+def test_iter_scopus_chunks_matches_full_read(analyzer, scopus_csv):
+    chunks = list(analyzer.iter_scopus_chunks(scopus_csv, chunksize=2))
+    assert [len(c) for c in chunks] == [2, 1]
+
+    combined = pd.concat(chunks)
+    full = analyzer.read_scopus_csv(scopus_csv)
+    assert list(combined.index) == list(full.index)
+    assert list(combined["Title"]) == ["Paper A", "Paper B", "Paper C"]
+    assert "Analysis Result" in combined.columns
+
+
+def test_missing_file_raises_file_processing_error(analyzer, tmp_path):
+    missing = str(tmp_path / "missing.csv")
+    with pytest.raises(FileProcessingError):
+        analyzer.read_scopus_csv(missing)
+    with pytest.raises(FileProcessingError):
+        list(analyzer.iter_scopus_chunks(missing))
+
+
+def test_valid_rows_mask_flags_missing_title_or_abstract():
+    df = pd.DataFrame({
+        "Title": ["Paper A", None, "Paper C", "Paper D"],
+        "Abstract": ["A long enough abstract", "Another abstract text", None, "short"],
+    })
+    mask = csv_mod.LiteratureAnalyzer.valid_rows_mask(df)
+    assert mask.tolist() == [True, False, False, False]
+
+
+def test_apply_results_to_dataframe_batch(analyzer, scopus_csv):
+    df = analyzer.read_scopus_csv(scopus_csv)
+    results = [
+        {"relevance_score": 90, "analysis": "very relevant", "literature_review_suggestion": "cite"},
+        {"relevance_score": 10, "analysis": "unrelated"},
+    ]
+    values = [analyzer.result_values(r) for r in results]
+    analyzer.apply_results_to_dataframe(df, [2, 0], values)
+
+    assert df.at[2, "Relevance Score"] == 90
+    assert df.at[0, "Analysis Result"] == "unrelated"
+    assert df.at[0, "Literature Review Suggestion"] == ""
+    assert pd.isna(df.at[1, "Analysis Result"])
+
+
+@pytest.mark.skipif(not csv_mod.PYARROW_AVAILABLE, reason="pyarrow not installed")
+def test_text_columns_use_arrow_strings(analyzer, scopus_csv):
+    df = analyzer.read_scopus_csv(scopus_csv)
+    for col in csv_mod.TEXT_COLUMNS:
+        assert df[col].dtype == pd.StringDtype("pyarrow")
+
+    analyzer.apply_result_to_dataframe(df, 1, {"relevance_score": 50, "analysis": "ok"})
+    assert df.at[1, "Analysis Result"] == "ok"
+    assert df["Analysis Result"].dtype == pd.StringDtype("pyarrow")
@@ -0,0 +1,17 @@
+"""Tests for the i18n translation lookup (litrx/i18n.py)."""
+
+from litrx.i18n import I18n, TRANSLATIONS
+
+
+def test_get_follows_language_change():
+    i18n = I18n("en")
+    assert i18n.get("error") == TRANSLATIONS["en"]["error"]
+
+    i18n.current_language = "zh"
+    assert i18n.get("error") == TRANSLATIONS["zh"]["error"]
+
+
+def test_get_formats_and_falls_back_to_key():
+    i18n = I18n("en")
+    assert i18n.get("error_read_file", error="boom") == "Failed to read file: boom"
+    assert i18n.get("no_such_key") == "no_such_key"
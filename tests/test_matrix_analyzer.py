@@ -0,0 +1,94 @@
+"""Tests for metadata loading and PDF matching in litrx/matrix_analyzer.py."""
+
+import pandas as pd
+import pytest
+
+from litrx.matrix_analyzer import build_pdf_metadata_mapping, read_metadata_file, save_results
+from litrx.utils import PYARROW_AVAILABLE
+
+
+@pytest.fixture
+def metadata_csv(tmp_path):
+    path = tmp_path / "zotero.csv"
+    path.write_text(
+        "Key,Title,DOI,Author,Year,Abstract\n"
+        'ABCD1234,Deep learning for NLP,10.1000/xyz123,"Smith, John",2020,"long\nabstract"\n'
+        "EFGH5678,Graph methods,,Doe,2019,other\n",
+        encoding="utf-8-sig",
+    )
+    return str(path)
+
+
+def test_read_metadata_file_csv(metadata_csv):
+    df = read_metadata_file(metadata_csv)
+    assert list(df["Key"]) == ["ABCD1234", "EFGH5678"]
+    assert df.loc[0, "Abstract"] == "long\nabstract"
+
+
+def test_build_pdf_metadata_mapping_match_types(metadata_csv):
+    df = read_metadata_file(metadata_csv)
+    pdfs = ["Deep learning for NLP.pdf", "EFGH5678.pdf", "unrelated.pdf"]
+    mapping = build_pdf_metadata_mapping(pdfs, df, {"id_columns": ["DOI", "Title", "Key"]})
+
+    assert list(mapping["PDF_File"]) == pdfs
+    assert list(mapping["Match_Status"]) == ["title_exact", "key", "not_matched"]
+    assert mapping.loc[1, "Title"] == "Graph methods"
+    assert pd.isna(mapping.loc[2, "Title"])
+
+
+def test_build_pdf_metadata_mapping_keeps_all_metadata_columns(metadata_csv):
+    df = read_metadata_file(metadata_csv)
+    mapping = build_pdf_metadata_mapping(["EFGH5678.pdf"], df, {"id_columns": ["Key"]})
+    assert mapping.loc[0, "Abstract"] == "other"
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+def test_save_results_writes_mapping_parquet(tmp_path, metadata_csv):
+    mapping = build_pdf_metadata_mapping(["EFGH5678.pdf"], read_metadata_file(metadata_csv), {"id_columns": ["Key"]})
+    results = pd.DataFrame({"PDF_File": ["EFGH5678.pdf"], "Method": ["survey"]})
+
+    save_results(results, mapping, str(tmp_path), {"file_type": "csv"})
+
+    stem = tmp_path.name
+    reloaded = pd.read_parquet(tmp_path / f"{stem}_metadata_mapping.parquet")
+    assert list(reloaded["PDF_File"]) == ["EFGH5678.pdf"]
+    assert (tmp_path / f"{stem}_metadata_mapping.csv").exists()
+
+
+def test_filename_parsing_matches_author_and_year(metadata_csv):
+    # A blank author earlier in the file must not break the scan
+    blank = pd.DataFrame([{"Key": "X", "Title": "zzz", "Author": "", "Year": 2020}])
+    df = pd.concat([blank, read_metadata_file(metadata_csv)], ignore_index=True)
+    mapping = build_pdf_metadata_mapping(["smith_2020_deep.pdf"], df, {"id_columns": ["Title"]})
+    assert mapping.loc[0, "Key"] == "ABCD1234"
+
+
+def test_get_ai_response_caches_content(tmp_path, monkeypatch):
+    from litrx import matrix_analyzer
+    from litrx.cache import ResultCache
+
+    monkeypatch.setattr(matrix_analyzer, "extract_pdf_text", lambda path: "pdf body text")
+
+    class Client:
+        calls = 0
+
+        def request(self, messages):
+            Client.calls += 1
+            return {"choices": [{"message": {"content": '{"method": "survey"}'}}]}
+
+    cache = ResultCache(cache_dir=tmp_path)
+    pdf = str(tmp_path / "paper.pdf")
+    first = matrix_analyzer.get_ai_response(pdf, "prompt", Client(), cache=cache)
+    second = matrix_analyzer.get_ai_response(pdf, "prompt", Client(), cache=cache)
+
+    assert first == second == '{"method": "survey"}'
+    assert Client.calls == 1
+
+
+def test_parse_zotero_filename():
+    from litrx.matrix_analyzer import parse_zotero_filename
+
+    assert parse_zotero_filename("Smith et al_2021_Deep nets.pdf") == {
+        "author": "smith et al", "year": "2021", "title": "deep nets",
+    }
+    assert parse_zotero_filename("no_year_here.pdf") == {}
@@ -0,0 +1,246 @@
+"""Tests for metadata matching, prompts, parsing and result staging in litrx/pdf_screener.py."""
+
+import json
+import threading
+import time
+
+import httpx
+import openai
+import pandas as pd
+import pytest
+
+from litrx.pdf_screener import (
+    build_pdf_metadata_mapping,
+    condense_pdf_text,
+    construct_batch_prompt,
+    load_staged_results,
+    parse_batch_ai_response_json,
+    prompt_cache_options,
+    _request_content,
+)
+
+CRITERIA = ["是否为实证研究"]
+QUESTIONS = [{"prompt_key": "method", "question_text": "研究方法", "df_column_name": "方法"}]
+
+
+def test_construct_batch_prompt_enumerates_documents():
+    prompt = construct_batch_prompt("INSTRUCTIONS", ["first text", "second text"])
+    assert prompt.startswith("INSTRUCTIONS")
+    assert "Document 1:\nfirst text\n---\nDocument 2:\nsecond text" in prompt
+
+
+def test_parse_batch_response_orders_by_pdf_index():
+    raw = json.dumps({
+        "results": [
+            {"pdf_index": 2, "screening_results": {"是否为实证研究": "否"}},
+            {"pdf_index": 1, "screening_results": {"是否为实证研究": "是"},
+             "detailed_analysis": {"method": "问卷"}},
+        ]
+    }, ensure_ascii=False)
+    parsed = parse_batch_ai_response_json(raw, 3, CRITERIA, QUESTIONS)
+
+    assert [p["screening_results"]["是否为实证研究"] for p in parsed] == ["是", "否", "缺失"]
+    assert parsed[0]["detailed_analysis"]["method"] == "问卷"
+    assert parsed[1]["detailed_analysis"]["method"] == "缺失"
+
+
+def test_parse_batch_response_invalid_json():
+    parsed = parse_batch_ai_response_json("not json at all", 2, CRITERIA, QUESTIONS)
+    assert len(parsed) == 2
+    assert all(p["screening_results"]["是否为实证研究"] == "解析失败" for p in parsed)
+
+
+def test_build_pdf_metadata_mapping_skips_missing_identifiers():
+    metadata = pd.DataFrame({
+        "DOI": ["10.1000/abc", None],
+        "Title": ["Deep learning", "Graph methods"],
+    })
+    mapping = build_pdf_metadata_mapping(
+        ["graph methods review.pdf", "10.1000/abc.pdf", "unknown.pdf"],
+        metadata,
+        ["DOI", "Title"],
+    )
+
+    assert list(mapping["PDF File"]) == ["graph methods review.pdf", "10.1000/abc.pdf", "unknown.pdf"]
+    assert list(mapping["Title"].fillna("")) == ["Graph methods", "Deep learning", ""]
+
+
+def test_load_staged_results_requires_matching_header(tmp_path):
+    path = tmp_path / "run_partial.csv"
+    path.write_text("PDF文件名,筛选_是否为实证研究\na.pdf,是\n", encoding="utf-8-sig")
+
+    staged = load_staged_results(str(path), ["PDF文件名", "筛选_是否为实证研究"])
+    assert staged == {"a.pdf": {"PDF文件名": "a.pdf", "筛选_是否为实证研究": "是"}}
+    assert load_staged_results(str(path), ["PDF文件名", "筛选_其他问题"]) == {}
+    assert load_staged_results(str(tmp_path / "missing.csv"), ["PDF文件名"]) == {}
+
+
+def test_condense_pdf_text_drops_references_and_keeps_conclusion():
+    body = "Abstract\nWe study X.\n" + "method text " * 200
+    text = body + "\n5 Conclusion\nX works.\nReferences\n[1] Someone 2020\n"
+
+    assert "[1] Someone" not in condense_pdf_text(text)
+    assert condense_pdf_text(text).endswith("X works.")
+
+    condensed = condense_pdf_text(text, token_budget=100)
+    assert len(condensed) <= 100 * 4 + len("\n...\n")
+    assert condensed.startswith("Abstract")
+    assert "5 Conclusion\nX works." in condensed
+
+
+def _rate_limited(retry_after):
+    response = httpx.Response(
+        429, headers={"retry-after": retry_after}, request=httpx.Request("POST", "https://api.test")
+    )
+    try:
+        raise openai.RateLimitError("rate limited", response=response, body=None)
+    except openai.RateLimitError as e:
+        # AIClient re-raises SDK errors as RuntimeError chained to the original
+        wrapped = RuntimeError("AI request failed")
+        wrapped.__cause__ = e
+        return wrapped
+
+
+def test_request_content_retries_transient_errors():
+    class FlakyClient:
+        calls = 0
+
+        def request(self, messages):
+            self.calls += 1
+            if self.calls == 1:
+                raise _rate_limited("0")
+            return {"choices": [{"message": {"content": "ok"}}]}
+
+    client = FlakyClient()
+    assert _request_content(client, "prompt") == "ok"
+    assert client.calls == 2
+
+
+def test_request_content_does_not_retry_other_errors():
+    class BrokenClient:
+        calls = 0
+
+        def request(self, messages):
+            self.calls += 1
+            raise RuntimeError("invalid api key")
+
+    client = BrokenClient()
+    with pytest.raises(RuntimeError):
+        _request_content(client, "prompt")
+    assert client.calls == 1
+
+
+def test_prompt_cache_options_only_for_official_openai_endpoint():
+    class Client:
+        def __init__(self, service, base_url):
+            self.service = service
+            self.client = type("SDK", (), {"base_url": base_url})()
+
+    options = prompt_cache_options(Client("openai", "https://api.openai.com/v1/"), "instructions")
+    assert options["extra_body"]["prompt_cache_key"].startswith("litrx-pdf-")
+    assert options == prompt_cache_options(Client("openai", "https://api.openai.com/v1/"), "instructions")
+    assert prompt_cache_options(Client("openai", "http://localhost:8000/v1/"), "instructions") == {}
+    assert prompt_cache_options(Client("siliconflow", "https://api.siliconflow.cn/v1/"), "instructions") == {}
+
+
+def _write_text_pdf(path, text):
+    """Write a one-page PDF whose extracted text is ``text``."""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+def test_screen_pdfs_resumes_after_interruption_with_cache_hits(tmp_path, monkeypatch):
+    from litrx import pdf_screener
+
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    prompts = []
+    # While set, requests after the first wait until the run is interrupted,
+    # standing in for a slow API call still in flight at that moment
+    hold = threading.Event()
+    interrupted = threading.Event()
+
+    class FakeClient:
+        model = "fake-model"
+
+        def __init__(self, config):
+            pass
+
+        def request(self, messages, **kwargs):
+            content = messages[0]["content"]
+            prompts.append(content)
+            if hold.is_set() and len(prompts) > 1:
+                interrupted.wait(5)
+                time.sleep(0.2)
+            answer = "是" if "paper-a" in content or "paper-c" in content else "否"
+            payload = {"screening_results": {"是否为实证研究": answer}, "detailed_analysis": {"method": "问卷"}}
+            return {"choices": [{"message": {"content": json.dumps(payload, ensure_ascii=False)}}]}
+
+    monkeypatch.setattr(pdf_screener, "AIClient", FakeClient)
+    folder = tmp_path / "papers"
+    folder.mkdir()
+    for name in ("a", "b"):
+        _write_text_pdf(folder / f"{name}.pdf", f"paper-{name}")
+
+    config = {
+        **pdf_screener.DEFAULT_CONFIG,
+        "INPUT_PDF_FOLDER_PATH": str(folder),
+        "OUTPUT_FILE_TYPE": "csv",
+        "API_REQUEST_DELAY": 0,
+        "MAX_WORKERS": 1,
+        "EXTRACT_PROCESSES": 1,
+    }
+    questions = {
+        "yes_no_questions": [{"key": "empirical", "question": "是否为实证研究", "column_name": "实证"}],
+        "open_questions": [{"key": "method", "question": "研究方法", "column_name": "方法"}],
+    }
+    staging = folder / "papers_analyzed_partial.csv"
+
+    # First run screens a and b and fills the result cache
+    pdf_screener.screen_pdfs(config, questions)
+    assert len(prompts) == 2 and not staging.exists()
+
+    # Second run: a and b are cache hits, then the run dies after screening c
+    new = ("c", "d", "e", "f", "g")
+    for name in new:
+        _write_text_pdf(folder / f"{name}.pdf", f"paper-{name}")
+    prompts.clear()
+    hold.set()
+
+    def interrupt(current, total):
+        if current == 3:
+            interrupted.set()
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        pdf_screener.screen_pdfs(config, questions, progress_callback=interrupt)
+    # Queued batches are cancelled; only the one already in flight still called the API
+    assert len(prompts) == 2
+    hold.clear()
+    staged = load_staged_results(str(staging), ["PDF文件名", "方法", "筛选_是否为实证研究"])
+    assert list(staged) == ["c.pdf"]
+
+    # Resumed run only asks about the PDFs that were not staged
+    prompts.clear()
+    output = pdf_screener.screen_pdfs(config, questions)
+    assert len(prompts) == 4 and not any("paper-c" in p for p in prompts)
+    assert not staging.exists()
+    result = pd.read_csv(output, encoding="utf-8-sig")
+    assert list(result["PDF文件名"]) == [f"{name}.pdf" for name in "abcdefg"]
+    assert list(result["筛选_是否为实证研究"]) == ["是", "否", "是", "否", "否", "否", "否"]
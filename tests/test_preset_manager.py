@@ -0,0 +1,45 @@
+"""Tests for MatrixPresetManager in litrx/preset_manager.py."""
+
+import os
+
+from litrx.preset_manager import MatrixPresetManager
+
+
+def _write_preset(path, title):
+    path.write_text(
+        f"dimensions:\n  - key: method\n    title: {title}\n    type: text\n",
+        encoding="utf-8",
+    )
+
+
+def test_load_preset_writes_and_reuses_parsed_cache(tmp_path):
+    preset = tmp_path / "demo.yaml"
+    _write_preset(preset, "研究方法")
+    manager = MatrixPresetManager(presets_dir=tmp_path)
+
+    config = manager.load_preset("demo")
+    assert config["dimensions"][0]["title"] == "研究方法"
+    assert (tmp_path / ".cache" / "demo.json").exists()
+
+    # Second load comes from the cache and returns an independent copy
+    config["dimensions"].clear()
+    assert manager.load_preset("demo")["dimensions"][0]["title"] == "研究方法"
+
+
+def test_parsed_cache_ignored_after_yaml_changes(tmp_path):
+    preset = tmp_path / "demo.yaml"
+    _write_preset(preset, "old")
+    manager = MatrixPresetManager(presets_dir=tmp_path)
+    manager.load_preset("demo")
+
+    _write_preset(preset, "new title")
+    stat = preset.stat()
+    os.utime(preset, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert manager.load_preset("demo")["dimensions"][0]["title"] == "new title"
+
+
+def test_cache_files_not_listed_as_presets(tmp_path):
+    _write_preset(tmp_path / "default.yaml", "x")
+    manager = MatrixPresetManager(presets_dir=tmp_path)
+    manager.load_preset("default")
+    assert [key for key, _ in manager.list_presets()] == ["default"]
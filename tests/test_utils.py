@@ -0,0 +1,203 @@
+"""Tests for shared helpers in litrx/utils.py."""
+
+import json
+import math
+
+import pytest
+
+from litrx.utils import (
+    AIResponseParser,
+    json_dump_file,
+    json_loads,
+    list_pdf_files,
+    read_csv_fast,
+    read_excel_fast,
+    write_csv_fast,
+    write_excel_fast,
+    write_xlsx_streaming,
+    yaml_safe_dump,
+    yaml_safe_load,
+)
+
+
+def test_json_loads_matches_stdlib():
+    text = '{"relevance_score": 85, "analysis": "相关", "nested": {"ok": true}}'
+    assert json_loads(text) == json.loads(text)
+
+
+def test_json_loads_accepts_stdlib_only_literals():
+    assert math.isnan(json_loads('{"score": NaN}')["score"])
+
+
+def test_json_loads_invalid_raises_json_error():
+    with pytest.raises(json.JSONDecodeError):
+        json_loads("not json")
+
+
+def test_json_dump_file_matches_stdlib_layout(tmp_path):
+    data = {"mode": {"description": "筛选", "open_questions": [], "yes_no_questions": [{"key": "k"}]}}
+    path = tmp_path / "questions_config.json"
+    path.write_text("old", encoding="utf-8")
+
+    json_dump_file(data, str(path))
+
+    assert path.read_text(encoding="utf-8") == json.dumps(data, ensure_ascii=False, indent=2)
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_yaml_helpers_round_trip_unicode():
+    config = {"dimensions": [{"key": "method", "title": "研究方法", "type": "text"}]}
+    text = yaml_safe_dump(config, allow_unicode=True, sort_keys=False)
+    assert "研究方法" in text
+    assert yaml_safe_load(text) == config
+
+
+def test_yaml_safe_load_rejects_python_tags():
+    import yaml
+
+    with pytest.raises(yaml.YAMLError):
+        yaml_safe_load("!!python/object/apply:os.system ['true']")
+
+
+def test_parse_relevance_response_strips_markdown():
+    text = '```json\n{"relevance_score": 70, "analysis": "ok"}\n```'
+    result = AIResponseParser.parse_relevance_response(text)
+    assert result == {"relevance_score": 70, "analysis": "ok"}
+
+
+def test_parse_json_with_fallback_uses_regex_for_malformed_json():
+    result = AIResponseParser.parse_json_with_fallback('{"relevance_score": 40, "analysis": "cut off')
+    assert result["relevance_score"] == 40
+
+
+def test_read_csv_fast_reads_bom_and_multiline_fields(tmp_path):
+    path = tmp_path / "papers.csv"
+    path.write_text('Title,Abstract\nPaper A,"line one\nline two"\nPaper B,"x, y"\n', encoding="utf-8-sig")
+    df = read_csv_fast(str(path), encoding="utf-8-sig")
+    assert list(df.columns) == ["Title", "Abstract"]
+    assert df["Abstract"].tolist() == ["line one\nline two", "x, y"]
+
+
+def test_read_csv_fast_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_csv_fast(str(tmp_path / "missing.csv"))
+
+
+def test_list_pdf_files_skips_directories_and_other_files(tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"%PDF")
+    (tmp_path / "B.PDF").write_bytes(b"%PDF")
+    (tmp_path / "notes.txt").write_text("x")
+    (tmp_path / "folder.pdf").mkdir()
+    assert sorted(list_pdf_files(str(tmp_path))) == ["B.PDF", "a.pdf"]
+
+
+def test_excel_fast_helpers_round_trip(tmp_path):
+    import pandas as pd
+
+    path = tmp_path / "meta.xlsx"
+    write_excel_fast(pd.DataFrame({"Title": ["A", "B"], "Year": [2020, 2021]}), str(path), index=False)
+    df = read_excel_fast(str(path))
+    assert list(df["Title"]) == ["A", "B"]
+    assert list(df["Year"]) == [2020, 2021]
+
+
+def test_write_xlsx_streaming_writes_missing_values_as_empty_cells(tmp_path):
+    import pandas as pd
+
+    path = tmp_path / "results.xlsx"
+    frame = pd.DataFrame({"Title": ["A", None], "Score": [1.5, float("nan")], "Year": [2020, 2021]})
+    write_xlsx_streaming(frame, str(path))
+    df = read_excel_fast(str(path))
+    assert list(df.columns) == ["Title", "Score", "Year"]
+    assert df["Title"].iloc[0] == "A" and pd.isna(df["Title"].iloc[1])
+    assert df["Score"].iloc[0] == 1.5 and pd.isna(df["Score"].iloc[1])
+    assert list(df["Year"]) == [2020, 2021]
+
+
+def test_write_csv_fast_keeps_bom_and_quoting(tmp_path):
+    import pandas as pd
+
+    df = pd.DataFrame({"标题": ["a,b", 'x"y', None], "Year": [2020, 2021, 2022]})
+    path = tmp_path / "out.csv"
+    write_csv_fast(df, str(path))
+
+    assert path.read_bytes().startswith(b"\xef\xbb\xbf")
+    back = pd.read_csv(path, encoding="utf-8-sig")
+    assert list(back.columns) == ["标题", "Year"]
+    assert back["标题"].tolist()[:2] == ["a,b", 'x"y']
+    assert back["Year"].tolist() == [2020, 2021, 2022]
+
+
+def test_write_csv_fast_writes_in_chunks_with_progress(tmp_path, monkeypatch):
+    import pandas as pd
+
+    import litrx.utils as utils
+
+    monkeypatch.setattr(utils, "CSV_WRITE_CHUNK_ROWS", 2)
+    df = pd.DataFrame({"Title": ["a", "b", "c", "d", "e"], "Note": [None, None, "x", "y", "z"]})
+    path = tmp_path / "out.csv"
+    progress = []
+    write_csv_fast(df, str(path), progress_callback=lambda done, total: progress.append((done, total)))
+
+    assert progress == [(2, 5), (4, 5), (5, 5)]
+    back = pd.read_csv(path, encoding="utf-8-sig")
+    assert back["Title"].tolist() == ["a", "b", "c", "d", "e"]
+    assert back["Note"].tolist()[2:] == ["x", "y", "z"]
+
+
+def test_write_csv_fast_formats_values_like_pandas(tmp_path):
+    import io
+
+    import pandas as pd
+
+    df = pd.DataFrame({
+        "标题": ["a,b", None],
+        "Included": [True, False],
+        "Date": pd.to_datetime(["2020-01-01", "2021-06-30"]),
+        "Score": [2.0, None],
+        "Year": [2020, 2021],
+    })
+    path = tmp_path / "out.csv"
+    write_csv_fast(df, str(path))
+
+    text = path.read_text(encoding="utf-8-sig")
+    assert text.splitlines()[0] == "标题,Included,Date,Score,Year"
+    assert "true" not in text and ".000000" not in text
+    expected = pd.read_csv(io.StringIO(df.to_csv(index=False)))
+    pd.testing.assert_frame_equal(pd.read_csv(path, encoding="utf-8-sig"), expected)
+
+
+def test_write_csv_fast_progress_never_goes_back_on_fallback(tmp_path, monkeypatch):
+    import pandas as pd
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    import litrx.utils as utils
+
+    monkeypatch.setattr(utils, "CSV_WRITE_CHUNK_ROWS", 2)
+    real_writer = pa_csv.CSVWriter
+
+    class FailingWriter:
+        """Writes two chunks, then fails like an unsupported column would."""
+
+        def __init__(self, *args, **kwargs):
+            self._writer = real_writer(*args, **kwargs)
+            self._chunks = 0
+
+        def write_table(self, table):
+            self._chunks += 1
+            if self._chunks == 3:
+                raise pa.ArrowNotImplementedError("unsupported")
+            self._writer.write_table(table)
+
+        def close(self):
+            self._writer.close()
+
+    monkeypatch.setattr(pa_csv, "CSVWriter", FailingWriter)
+    df = pd.DataFrame({"Title": ["a", "b", "c", "d", "e"], "Year": [1, 2, 3, 4, 5]})
+    path = tmp_path / "out.csv"
+    progress = []
+    write_csv_fast(df, str(path), progress_callback=lambda done, total: progress.append(done))
+
+    assert progress == [2, 4, 5]
+    assert pd.read_csv(path, encoding="utf-8-sig")["Title"].tolist() == ["a", "b", "c", "d", "e"]